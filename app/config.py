@@ -17,9 +17,76 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
+    REDIS_CACHE_ENABLED: bool = False  # Share the response cache across workers
+
+    # Token blacklist / refresh token store: "disabled", "memory" or "redis"
+    # (app/services/token_service.py)
+    TOKEN_BACKEND: str = "disabled"
+    REDIS_POOL_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 0.5
+    REDIS_BREAKER_FAILURES: int = 3
+    REDIS_BREAKER_RESET_SECONDS: float = 10.0
+
+    # Cross-worker invalidation over PostgreSQL LISTEN/NOTIFY
+    INVALIDATION_BUS_ENABLED: bool = True
+    INVALIDATION_CHANNEL: str = "cache_invalidation"
+    INVALIDATION_RECONNECT_SECONDS: int = 5
+
+    # Verified JWT payload cache (app/services/token_cache.py)
+    JWT_CACHE_ENABLED: bool = True
+    JWT_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Authenticated user cache (app/services/principal_cache.py)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+
+    # bcrypt thread pool (app/services/password_service.py)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
 
     TMDB_API_KEY: str = ""  # TMDB API key for fetching movie data
 
+    # Trending ranking (app/services/trending_service.py)
+    TRENDING_WINDOW_DAYS: int = 7
+    TRENDING_HALF_LIFE_HOURS: float = 24.0
+    TRENDING_REFRESH_SECONDS: int = 300
+    TRENDING_SIZE: int = 50
+
+    # Recommended movie candidate pool (app/services/recommend_service.py)
+    RECOMMEND_MIN_RATING: float = 3.0
+    RECOMMEND_REFRESH_SECONDS: int = 600
+
+    # Item-item collaborative filtering (app/services/cf_service.py)
+    CF_NEIGHBORS: int = 50
+    CF_REFRESH_SECONDS: int = 1800
+
+    # Content-based similar movies (app/services/similar_service.py)
+    SIMILAR_INDEX_DIR: str = "data/similar_index"
+    SIMILAR_NEIGHBORS: int = 20
+    SIMILAR_REFRESH_SECONDS: int = 3600
+
+    # Title/director autocomplete index (app/services/autocomplete_service.py)
+    AUTOCOMPLETE_REFRESH_SECONDS: int = 3600
+
+    # Write-behind like counters (app/services/like_service.py)
+    LIKE_BUFFER_ENABLED: bool = True
+    LIKE_FLUSH_SECONDS: float = 2.0
+    LIKE_RECONCILE_SECONDS: int = 300
+
+    # In-process response cache (app/services/cache.py)
+    CACHE_TTL_SECONDS: int = 60
+    CACHE_MAX_ENTRIES: int = 10_000
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # L1 in front of Redis: hot keys only (app/services/shared_cache.py)
+    CACHE_L1_TTL_SECONDS: int = 5
+    CACHE_L1_MAX_ENTRIES: int = 1000
+    CACHE_L1_MAX_BYTES: int = 8 * 1024 * 1024
+    CACHE_HOT_KEY_THRESHOLD: int = 20
+    CACHE_HOT_KEY_WINDOW_SECONDS: int = 10
+    # Cache-Control for conditional catalog reads (app/services/http_cache.py)
+    HTTP_MAX_AGE_SECONDS: int = 30
+    HTTP_STALE_WHILE_REVALIDATE_SECONDS: int = 60
+
     class Config:
         env_file = ".env"
 
@@ -1,11 +1,13 @@
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
-from app.database import get_db
+from jose import JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models import User
-from app.utils import SECRET_KEY, ALGORITHM
 from app.services.token_service import TokenBlacklistService
+from app.services.principal_cache import principal_cache
+from app.services.token_cache import verified_tokens
 from typing import Optional
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
@@ -14,7 +16,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=Fals
 async def get_current_user(
     request: Request,
     token: Optional[str] = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -32,6 +34,7 @@ async def get_current_user(
 
     # Check if token is blacklisted (async)
     if await TokenBlacklistService.is_blacklisted(token):
+        verified_tokens.evict(token)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked",
@@ -39,14 +42,39 @@ async def get_current_user(
         )
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = verified_tokens.decode(token)
         email: Optional[str] = payload.get("sub")
         if email is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == email).first()
+    user = principal_cache.get(email)
     if user is None:
+        user = (await db.execute(select(User).where(User.email == email))).scalar()
+        if user is None:
+            raise credentials_exception
+        principal_cache.set(user)
+        # End the read transaction so the pooled connection is not held for
+        # the rest of the request (detach first: rollback expires instances)
+        db.expunge(user)
+        await db.rollback()
+
+    # Tokens carry the uid they were issued for, so a token whose email was
+    # since given to another account (admin update_user) is rejected
+    token_uid = payload.get("uid")
+    if token_uid is not None and token_uid != user.uid:
         raise credentials_exception
-    return user
\ No newline at end of file
+    return user
+
+
+async def get_current_user_optional(
+    request: Request,
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> Optional[User]:
+    """Same as get_current_user, but returns None for anonymous requests."""
+    try:
+        return await get_current_user(request, token, db)
+    except HTTPException:
+        return None
@@ -1,14 +1,87 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import auth, movies, reviews, admin, user
 
-from app.database import engine, Base
+from app.config import settings
+from app.database import engine, async_engine, Base
+from app.redis_client import redis_pool
+from app.services import (
+    background,
+    trending_service,
+    recommend_service,
+    cf_service,
+    similar_service,
+    autocomplete_service,
+    invalidation_bus,
+    like_service,
+    password_service,
+)
 
 
 # Create tables if not exists (redundant if init_db run, but safe)
 # Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+background.register_task(
+    "trending-refresh",
+    settings.TRENDING_REFRESH_SECONDS,
+    trending_service.run_refresh,
+)
+background.register_task(
+    "recommend-pool-refresh",
+    settings.RECOMMEND_REFRESH_SECONDS,
+    recommend_service.run_refresh,
+)
+background.register_task(
+    "cf-model-rebuild",
+    settings.CF_REFRESH_SECONDS,
+    cf_service.run_rebuild,
+)
+background.register_task(
+    "similar-index-rebuild",
+    settings.SIMILAR_REFRESH_SECONDS,
+    similar_service.run_rebuild,
+)
+background.register_task(
+    "autocomplete-index-rebuild",
+    settings.AUTOCOMPLETE_REFRESH_SECONDS,
+    autocomplete_service.run_rebuild,
+)
+
+if settings.LIKE_BUFFER_ENABLED:
+    background.register_task(
+        "like-counter-flush",
+        settings.LIKE_FLUSH_SECONDS,
+        like_service.run_flush,
+    )
+background.register_task(
+    "like-counter-reconcile",
+    settings.LIKE_RECONCILE_SECONDS,
+    like_service.run_reconcile,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.TOKEN_BACKEND == "redis":
+        await redis_pool.start()
+    background.start_all()
+    invalidation_bus.listener.start()
+    yield
+    invalidation_bus.listener.stop()
+    await background.stop_all()
+    password_service.password_hasher.shutdown()
+    await async_engine.dispose()
+    await redis_pool.close()
+    # Don't drop counter changes buffered since the last flush
+    try:
+        await asyncio.to_thread(like_service.like_buffer.flush)
+    except Exception as e:
+        print(f"Error flushing like counters: {e}")
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,  # ty:ignore[invalid-argument-type]
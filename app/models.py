@@ -8,7 +8,10 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Numeric,
+    Float,
     CHAR,
+    Index,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -41,14 +44,63 @@ class Movie(Base):
     mid = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     dec = Column(Text, nullable=True)
-    rat = Column(Numeric(2, 1), default=0)
+    rat = Column(Numeric(2, 1), default=0, index=True)
+    # Rating the movie came with; rat falls back to it while it has no reviews
+    imported_rat = Column(Numeric(2, 1), nullable=True)
+    # Running review aggregates; rat = round(rating_sum / rating_count, 1)
+    rating_sum = Column(
+        Numeric(12, 1), nullable=False, default=0, server_default="0"
+    )
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
     release_date = Column(Date, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Version stamp for ETag / Last-Modified (app/services/http_cache.py)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        index=True,
+    )
     director = Column(String(100), nullable=True)  # Added director
     poster_url = Column(String(255), nullable=True)  # Added for UI
 
-    genres = relationship("MovieGenre", back_populates="movie")
-    reviews = relationship("Review", back_populates="movie")
+    # Deleting a movie leaves genre links and reviews to ON DELETE CASCADE
+    genres = relationship("MovieGenre", back_populates="movie", passive_deletes=True)
+    reviews = relationship("Review", back_populates="movie", passive_deletes=True)
+
+    # pg_trgm GIN indexes back ILIKE '%keyword%' search (requires pg_trgm)
+    __table_args__ = (
+        Index(
+            "ix_movie_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_movie_director_trgm",
+            "director",
+            postgresql_using="gin",
+            postgresql_ops={"director": "gin_trgm_ops"},
+        ),
+        # Backs the RATING keyset in /api/movies/search
+        Index("ix_movie_rat_sort", func.coalesce(rat, 0).desc(), mid.desc()),
+    )
+
+
+class MovieTrend(Base):
+    """Precomputed trending ranking, rebuilt by app/services/trending_service.py"""
+
+    __tablename__ = "movie_trend"
+
+    rank = Column(Integer, primary_key=True)
+    mid = Column(
+        Integer,
+        ForeignKey("movie.mid", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+    score = Column(Float, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class Genre(Base):
@@ -59,6 +111,15 @@ class Genre(Base):
 
     movies = relationship("MovieGenre", back_populates="genre")
 
+    __table_args__ = (
+        Index(
+            "ix_genre_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
 
 class MovieGenre(Base):
     __tablename__ = "movie_genre"
@@ -79,13 +140,30 @@ class Review(Base):
     title = Column(String(200), nullable=True)
     dec = Column(Text, nullable=False)
     rat = Column(Numeric(2, 1), nullable=True)  # Check 1-5
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+    # Denormalized review_like counters (app/services/like_service.py)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    dislike_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     user = relationship("User", back_populates="reviews")
     movie = relationship("Movie", back_populates="reviews")
     comments = relationship("Comment", back_populates="review")
     likes = relationship("ReviewLike", back_populates="review")
 
+    __table_args__ = (
+        # One review per user and movie (ON CONFLICT target of review creation)
+        UniqueConstraint("uid", "mid", name="review_uid_mid_key"),
+        # Backs the keyset-paginated review list of a movie (newest first)
+        Index(
+            "ix_review_mid_created_at",
+            "mid",
+            created_at.desc(),
+            rid.desc(),
+        ),
+    )
+
 
 class Comment(Base):
     __tablename__ = "comment"
@@ -94,12 +172,20 @@ class Comment(Base):
     rid = Column(Integer, ForeignKey("review.rid", ondelete="CASCADE"), nullable=False)
     uid = Column(Integer, ForeignKey("users.uid", ondelete="CASCADE"), nullable=False)
     dec = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+    # Denormalized comment_like counters (app/services/like_service.py)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    dislike_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     review = relationship("Review", back_populates="comments")
     user = relationship("User", back_populates="comments")
     likes = relationship("CommentLike", back_populates="comment")
 
+    # Backs the keyset-paginated comment thread of a review (oldest first)
+    __table_args__ = (Index("ix_comment_rid_created_at", "rid", created_at, cid),)
+
 
 class ReviewLike(Base):
     __tablename__ = "review_like"
@@ -107,11 +193,22 @@ class ReviewLike(Base):
     lid = Column(Integer, primary_key=True, index=True)
     rid = Column(Integer, ForeignKey("review.rid", ondelete="CASCADE"), nullable=False)
     uid = Column(Integer, ForeignKey("users.uid", ondelete="CASCADE"), nullable=False)
-    type = Column(CHAR(1), nullable=True)  # L or D
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    type = Column(CHAR(1), nullable=True)  # L or D, NULL once toggled off
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+    # Lets the counter reconcile job find recently toggled rows
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
 
     review = relationship("Review", back_populates="likes")
 
+    # One reaction per user and review (ON CONFLICT target of the like toggle)
+    __table_args__ = (
+        UniqueConstraint("rid", "uid", name="review_like_rid_uid_key"),
+    )
+
 
 class CommentLike(Base):
     __tablename__ = "comment_like"
@@ -119,7 +216,15 @@ class CommentLike(Base):
     lid = Column(Integer, primary_key=True, index=True)
     cid = Column(Integer, ForeignKey("comment.cid", ondelete="CASCADE"), nullable=False)
     uid = Column(Integer, ForeignKey("users.uid", ondelete="CASCADE"), nullable=False)
-    type = Column(CHAR(1), nullable=True)  # L or D
+    type = Column(CHAR(1), nullable=True)  # L or D, NULL once toggled off
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
 
     comment = relationship("Comment", back_populates="likes")
+
+    # One reaction per user and comment
+    __table_args__ = (
+        UniqueConstraint("cid", "uid", name="comment_like_cid_uid_key"),
+    )
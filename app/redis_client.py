@@ -1,22 +1,248 @@
-# from redis.asyncio import Redis
-# from app.config import settings
-
-
-# def get_redis_client() -> Redis:
-#     """
-#     Create and return a new async Redis client instance.
-
-#     Returns:
-#         Async Redis client instance
-#     """
-#     return Redis(
-#         host=settings.REDIS_HOST,
-#         port=settings.REDIS_PORT,
-#         db=settings.REDIS_DB,
-#         password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
-#         decode_responses=True,  # Automatically decode responses to strings
-#     )
-# Redis 비활성화 (개발 / 학교 환경)
-
-def get_redis_client():
-    return None
\ No newline at end of file
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import redis
+import redis.asyncio
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from app.config import settings
+from app.utils import percentile_ms
+
+T = TypeVar("T")
+
+# Recent command latencies kept for percentiles
+SAMPLE_SIZE = 1024
+
+
+# ─────────────────────────────────────────────
+# Token store (app/services/token_service.py)
+# ─────────────────────────────────────────────
+class RedisUnavailable(Exception):
+    """Redis is not configured, the circuit is open, or the command failed."""
+
+
+class CircuitBreaker:
+    """
+    Fail fast while Redis is down.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    every call is refused for `reset_seconds`. Then one trial call is let
+    through (half-open): success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.reset_seconds
+            ):
+                self.state = self.HALF_OPEN
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.opened += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutiveFailures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class AsyncRedisPool:
+    """
+    One `redis.asyncio` connection pool shared by every request.
+
+    Created in the app lifespan (`start`) and closed on shutdown (`close`).
+    Idle connections are PINGed before reuse (health_check_interval). All
+    commands go through `call`, which applies the circuit breaker and
+    records latency.
+    """
+
+    def __init__(self):
+        self._pool: Optional[redis.asyncio.ConnectionPool] = None
+        self.client: Optional[redis.asyncio.Redis] = None
+        self.breaker = CircuitBreaker(
+            settings.REDIS_BREAKER_FAILURES, settings.REDIS_BREAKER_RESET_SECONDS
+        )
+        self._latencies = deque(maxlen=SAMPLE_SIZE)
+        self.calls = 0
+        self.errors = 0
+
+    async def start(self):
+        self._pool = redis.asyncio.ConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+            max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            health_check_interval=30,
+            decode_responses=True,  # Automatically decode responses to strings
+        )
+        self.client = redis.asyncio.Redis(connection_pool=self._pool)
+        try:
+            await self.call(lambda client: client.ping())
+        except RedisUnavailable as e:
+            # Start anyway; the breaker retries after REDIS_BREAKER_RESET_SECONDS
+            print(f"Error connecting to Redis: {e}")
+
+    async def close(self):
+        client, self.client = self.client, None
+        pool, self._pool = self._pool, None
+        if client is not None:
+            await client.aclose()
+        if pool is not None:
+            await pool.aclose()
+
+    async def call(self, command: Callable[[redis.asyncio.Redis], Awaitable[T]]) -> T:
+        """
+        Run `command(client)`.
+
+        Raises:
+            RedisUnavailable: If the pool is not started, the circuit is open
+                or the command failed
+        """
+        client = self.client
+        if client is None:
+            raise RedisUnavailable("Redis pool is not started")
+        if not self.breaker.allow():
+            raise RedisUnavailable("Redis circuit is open")
+
+        start = time.perf_counter()
+        try:
+            result = await command(client)
+        except (redis.RedisError, OSError, asyncio.TimeoutError) as e:
+            self.errors += 1
+            self.breaker.record_failure()
+            raise RedisUnavailable(str(e)) from e
+        self._latencies.append(time.perf_counter() - start)
+        self.calls += 1
+        self.breaker.record_success()
+        return result
+
+    def stats(self) -> dict:
+        pool = self._pool
+        in_use = len(getattr(pool, "_in_use_connections", ()))
+        idle = len(getattr(pool, "_available_connections", ()))
+        latencies = list(self._latencies)
+        return {
+            "started": self.client is not None,
+            "pool": {
+                "maxConnections": settings.REDIS_POOL_MAX_CONNECTIONS,
+                "open": in_use + idle,
+                "inUse": in_use,
+                "idle": idle,
+            },
+            "calls": self.calls,
+            "errors": self.errors,
+            "latencyMs": {
+                "p50": percentile_ms(latencies, 0.5),
+                "p99": percentile_ms(latencies, 0.99),
+            },
+            "breaker": self.breaker.stats(),
+        }
+
+
+redis_pool = AsyncRedisPool()
+
+
+def get_redis_client() -> Optional[redis.asyncio.Redis]:
+    """Shared async Redis client, None until the lifespan has started the pool."""
+    return redis_pool.client
+
+
+# ─────────────────────────────────────────────
+# Response cache (app/services/shared_cache.py)
+# ─────────────────────────────────────────────
+class BreakerRedis(redis.Redis):
+    """
+    Sync client whose commands go through a `CircuitBreaker`.
+
+    While the circuit is open, commands raise `redis.ConnectionError` at once
+    instead of waiting for socket timeouts, so callers fall back right away.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, **kwargs):
+        super().__init__(**kwargs)
+        self.breaker = breaker
+
+    def execute_command(self, *args, **options):
+        if not self.breaker.allow():
+            raise redis.ConnectionError("Redis circuit is open")
+        try:
+            result = super().execute_command(*args, **options)
+        except (redis.ConnectionError, redis.TimeoutError, OSError):
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+
+cache_breaker = CircuitBreaker(
+    settings.REDIS_BREAKER_FAILURES, settings.REDIS_BREAKER_RESET_SECONDS
+)
+_cache_client = None
+
+
+def get_cache_redis():
+    """
+    Shared Redis client for the response cache.
+
+    A single client (with its own connection pool) is reused for every
+    request. Commands are tried once (no retries) behind `cache_breaker`.
+    Returns None when REDIS_CACHE_ENABLED is off.
+    """
+    global _cache_client
+    if not settings.REDIS_CACHE_ENABLED:
+        return None
+    if _cache_client is None:
+        _cache_client = BreakerRedis(
+            cache_breaker,
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+            health_check_interval=30,
+            retry=Retry(NoBackoff(), 0),
+        )
+    return _cache_client
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
@@ -10,6 +10,14 @@ from app.database import get_db
 from app.models import User, Movie, Review, Genre, MovieGenre
 from app.dependencies import get_current_user
 from app.config import settings
+from app.services.rating_service import apply_review_rating, remove_user_ratings
+from app.services.like_service import like_buffer, remove_user_reactions
+from app.services import catalog_events, invalidation_bus
+from app.services.shared_cache import shared_cache
+from app.services.password_service import password_hasher
+from app.services.principal_cache import principal_cache
+from app.services.token_cache import verified_tokens
+from app.redis_client import redis_pool
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -241,6 +249,7 @@ def update_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    old_nickname, old_email = user.nickname, user.email
     if data.name is not None:
         user.name = data.name
     if data.nickname is not None:
@@ -253,6 +262,8 @@ def update_user(
         user.gender = data.gender
 
     db.commit()
+    catalog_events.invalidate_user(old_nickname, user.nickname)
+    principal_cache.invalidate(old_email, user.email)
     return {"message": "User updated successfully"}
 
 
@@ -268,8 +279,15 @@ def delete_user(
     if user.uid == admin.uid:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
 
+    # 유저 리뷰/좋아요가 함께 삭제되므로 평점·좋아요 집계에서 먼저 제외
+    nickname, email = user.nickname, user.email
+    remove_user_ratings(db, user.uid)
+    remove_user_reactions(db, user.uid)
     db.delete(user)
     db.commit()
+    catalog_events.invalidate_catalog()
+    catalog_events.invalidate_user(nickname)
+    principal_cache.invalidate(email)
     return {"message": "User deleted successfully"}
 
 
@@ -313,6 +331,7 @@ def get_all_movies(
 @router.post("/movies")
 def create_movie(
     data: MovieCreateRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
@@ -331,6 +350,7 @@ def create_movie(
         director=data.director,
         poster_url=data.posterUrl,
         release_date=release_date,
+        imported_rat=0,
     )
     db.add(movie)
     db.commit()
@@ -349,13 +369,26 @@ def create_movie(
         db.add(movie_genre)
 
     db.commit()
+    catalog_events.invalidate_movie(movie.mid)
+    background_tasks.add_task(catalog_events.movie_changed, movie.mid)
     return {"message": "Movie created successfully", "movieId": movie.mid}
 
 
+def _reviewer_nicknames(db: Session, movie_id: int) -> List[str]:
+    """Users whose cached profile may list a review of this movie."""
+    rows = (
+        db.query(User.nickname)
+        .join(Review, Review.uid == User.uid)
+        .filter(Review.mid == movie_id)
+    )
+    return [nickname for (nickname,) in rows]
+
+
 @router.put("/movies/{movie_id}")
 def update_movie(
     movie_id: int,
     data: MovieUpdateRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
@@ -363,7 +396,10 @@ def update_movie(
     if not movie:
         raise HTTPException(status_code=404, detail="Movie not found")
 
-    if data.title is not None:
+    # Profiles show movieTitle for each review
+    reviewers = []
+    if data.title is not None and data.title != movie.title:
+        reviewers = _reviewer_nicknames(db, movie_id)
         movie.title = data.title
     if data.description is not None:
         movie.dec = data.description
@@ -380,19 +416,32 @@ def update_movie(
             pass
 
     db.commit()
+    catalog_events.invalidate_movie(movie_id)
+    if reviewers:
+        catalog_events.invalidate_user(*reviewers)
+    background_tasks.add_task(catalog_events.movie_changed, movie_id)
     return {"message": "Movie updated successfully"}
 
 
 @router.delete("/movies/{movie_id}")
 def delete_movie(
-    movie_id: int, db: Session = Depends(get_db), admin: User = Depends(require_admin)
+    movie_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
 ):
     movie = db.query(Movie).filter(Movie.mid == movie_id).first()
     if not movie:
         raise HTTPException(status_code=404, detail="Movie not found")
 
+    # Their reviews are deleted with the movie (ON DELETE CASCADE)
+    reviewers = _reviewer_nicknames(db, movie_id)
     db.delete(movie)
     db.commit()
+    catalog_events.invalidate_movie(movie_id)
+    if reviewers:
+        catalog_events.invalidate_user(*reviewers)
+    background_tasks.add_task(catalog_events.movie_deleted, movie_id)
     return {"message": "Movie deleted successfully"}
 
 
@@ -443,17 +492,47 @@ def delete_review(
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
 
+    movie_id = review.mid
+    nickname = review.user.nickname if review.user else None
+    apply_review_rating(db, movie_id, review.rat, added=False)
     db.delete(review)
     db.commit()
+    catalog_events.invalidate_movie(movie_id)
+    if nickname:
+        catalog_events.invalidate_user(nickname)
     return {"message": "Review deleted successfully"}
 
 
+# ─────────────────────────────────────────────
+# Cache
+# ─────────────────────────────────────────────
+@router.get("/cache-stats")
+def get_cache_stats(admin: User = Depends(require_admin)):
+    return {
+        **shared_cache.stats(),
+        "invalidationBus": invalidation_bus.listener.stats(),
+        "likeBuffer": like_buffer.stats(),
+    }
+
+
+@router.get("/auth-stats")
+def get_auth_stats(admin: User = Depends(require_admin)):
+    return {
+        "passwordHasher": password_hasher.stats(),
+        "principalCache": principal_cache.stats(),
+        "jwtCache": verified_tokens.stats(),
+        "tokenBackend": settings.TOKEN_BACKEND,
+        "redis": redis_pool.stats(),
+    }
+
+
 # ─────────────────────────────────────────────
 # TMDB Movie Import
 # ─────────────────────────────────────────────
 @router.post("/movies/import-tmdb")
 async def import_movie_from_tmdb(
     request: TMDBMovieRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
@@ -570,6 +649,7 @@ async def import_movie_from_tmdb(
                 else None
             ),
             rat=0,
+            imported_rat=0,
         )
 
         db.add(new_movie)
@@ -589,6 +669,8 @@ async def import_movie_from_tmdb(
             db.add(movie_genre)
 
         db.commit()
+        catalog_events.invalidate_movie(new_movie.mid)
+        background_tasks.add_task(catalog_events.movie_changed, new_movie.mid)
 
         return {
             "message": "Content imported successfully",
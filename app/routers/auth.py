@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Response, Request
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models import User
 from app.schemas import (
     UserCreate,
@@ -10,33 +11,45 @@ from app.schemas import (
     TokenResponse,
     RefreshTokenRequest,
 )
-from app.utils import (
-    verify_password,
-    get_password_hash,
-    create_access_token,
-    create_refresh_token,
-    decode_token,
-)
+from app.utils import create_access_token, create_refresh_token
 from app.dependencies import get_current_user
 from app.services.token_service import TokenBlacklistService, RefreshTokenService
+from app.services.password_service import PasswordHasherBusy, password_hasher
+from app.services.token_cache import verified_tokens
 from jose import JWTError
 from datetime import timedelta
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Too many login requests, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserResponse)
-async def register(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def register(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await db.scalar(select(User.uid).where(User.email == user.email))
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    db_nickname = db.query(User).filter(User.nickname == user.nickname).first()
+    db_nickname = await db.scalar(
+        select(User.uid).where(User.nickname == user.nickname)
+    )
     if db_nickname:
         raise HTTPException(status_code=400, detail="Nickname already taken")
 
-    # Hash password (bcrypt includes salt automatically)
-    hashed_pw = get_password_hash(user.password)
+    # Hash password (bcrypt includes salt automatically), off the event loop.
+    # End the read transaction first so the pooled connection is not held
+    # while waiting for bcrypt.
+    await db.rollback()
+    try:
+        hashed_pw = await password_hasher.hash(user.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
     # Create user
     new_user = User(
@@ -48,38 +61,48 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
         bio=user.bio,
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     return new_user
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(response: Response, user_in: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_in.email).first()
+async def login(
+    response: Response, user_in: UserLogin, db: AsyncSession = Depends(get_async_db)
+):
+    user = await db.scalar(select(User).where(User.email == user_in.email))
     if not user:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
 
-    # Verify password (bcrypt hash includes salt)
-    if not verify_password(user_in.password, str(user.password)):
+    # Verify password (bcrypt hash includes salt), off the event loop.
+    # End the read transaction first so the pooled connection is not held
+    # while waiting for bcrypt.
+    uid, email, hashed_password = user.uid, str(user.email), str(user.password)
+    await db.rollback()
+    try:
+        valid = await password_hasher.verify(user_in.password, hashed_password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+    if not valid:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
 
     # Set token expiration based on remember_me
     # If remember_me is True, token lasts 7 days; otherwise 30 minutes
     token_expires = timedelta(days=7) if user_in.remember_me else timedelta(minutes=30)
     access_token = create_access_token(
-        data={"sub": str(user.email)}, expires_delta=token_expires
+        data={"sub": email, "uid": uid}, expires_delta=token_expires
     )
 
     # Create refresh token (always valid for 7 days)
     refresh_token_expires = timedelta(days=7)
     refresh_token = create_refresh_token(
-        data={"sub": str(user.email)}, expires_delta=refresh_token_expires
+        data={"sub": email}, expires_delta=refresh_token_expires
     )
 
     # Store refresh token in Redis (async)
     await RefreshTokenService.store_refresh_token(
-        email=str(user.email),
+        email=email,
         refresh_token=refresh_token,
         expires_delta=refresh_token_expires,
     )
@@ -138,6 +161,7 @@ async def logout(
     # Add access token to blacklist (async)
     if access_token:
         await TokenBlacklistService.add_to_blacklist(access_token)
+        verified_tokens.evict(access_token)
 
     # Delete refresh token from Redis (async)
     await RefreshTokenService.delete_refresh_token(str(current_user.email))
@@ -151,7 +175,7 @@ async def logout(
 
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_access_token(
-    response: Response, request: Request, db: Session = Depends(get_db)
+    response: Response, request: Request, db: AsyncSession = Depends(get_async_db)
 ):
     """
     Refresh access token using refresh token.
@@ -170,7 +194,7 @@ async def refresh_access_token(
 
     try:
         # Decode refresh token
-        payload = decode_token(refresh_token)
+        payload = verified_tokens.decode(refresh_token)
         email = payload.get("sub")
         token_type = payload.get("type")
 
@@ -185,13 +209,14 @@ async def refresh_access_token(
             )
 
         # Get user from database
-        user = db.query(User).filter(User.email == email).first()
+        user = await db.scalar(select(User).where(User.email == email))
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
 
         # Create new access token
         access_token = create_access_token(
-            data={"sub": str(user.email)}, expires_delta=timedelta(minutes=30)
+            data={"sub": str(user.email), "uid": user.uid},
+            expires_delta=timedelta(minutes=30),
         )
 
         # Create new refresh token
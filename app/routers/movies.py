@@ -1,15 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, tuple_
 from app.database import get_db
-from app.models import Movie, MovieGenre, Genre
+from app.models import Movie, MovieTrend, User
 from app.schemas import (
     MovieResponseItem,
     MovieDetailResponse,
     MovieSearchResponse,
     MovieSearchRequest,
+    MovieAutocompleteItem,
 )
-from typing import List
+from app.services.movie_service import (
+    TREND_CACHE_KEY,
+    TREND_VERSION_KEY,
+    build_movie_items,
+    catalog_version,
+    detail_cache_key,
+    detail_version_key,
+    get_movie_cards,
+    load_genre_names,
+    movie_version,
+)
+from app.services.http_cache import conditional_response
+from app.services.pagination import encode_cursor, decode_cursor
+from app.services.search_service import keyword_filter, relevance, genre_facets
+from app.services.recommend_service import sample_movie_ids
+from app.services.cf_service import recommend_for_user
+from app.services.similar_service import similar_index
+from app.services.autocomplete_service import autocomplete_index
+from app.dependencies import get_current_user_optional
+from decimal import Decimal
+from typing import List, Optional
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
@@ -20,111 +41,183 @@ def search_movies(
     searchType: str = "TITLE",
     page: int = 0,
     size: int = 20,
+    sortBy: str = "ID",
+    cursor: Optional[str] = None,
+    withTotal: bool = True,
+    withFacets: bool = False,
     db: Session = Depends(get_db),
 ):
+    """
+    영화 검색.
+
+    - 기존 방식: `page`/`size` (OFFSET) + `totalPages`
+    - 커서 방식: `cursor` 파라미터를 보내면 keyset 페이지네이션으로 동작
+      (첫 페이지는 `cursor=` 빈 값). 응답의 `nextCursor`를 다음 요청에 그대로 전달.
+      `withTotal=false`이면 COUNT 쿼리를 생략하고 `totalPages`는 null.
+    - `sortBy`: ID(기본), RATING, RELEVANCE(트라이그램 유사도, OFFSET 방식만 지원)
+    - `withFacets=true`이면 검색 결과 전체의 장르별 개수를 `facets`로 함께 반환
+    - `size`는 1~100 으로 제한
+    """
+    size = max(1, min(size, 100))
     query = db.query(Movie)
 
-    if keyword:
-        if searchType == "TITLE":
-            query = query.filter(Movie.title.ilike(f"%{keyword}%"))
-        elif searchType == "DIRECTOR":
-            query = query.filter(Movie.director.ilike(f"%{keyword}%"))
-        elif searchType == "GENRE":
-            query = (
-                query.join(MovieGenre)
-                .join(Genre)
-                .filter(Genre.name.ilike(f"%{keyword}%"))
-            )
+    condition = keyword_filter(keyword, searchType)
+    if condition is not None:
+        query = query.filter(condition)
 
-    total_count = query.count()
-    movies = query.offset(page * size).limit(size).all()
-
-    total_pages = (total_count + size - 1) // size
-
-    result = []
-    for m in movies:
-        genres = [g.genre.name for g in m.genres]
-        result.append(
-            MovieResponseItem(
-                id=m.mid,
-                title=m.title,
-                posterUrl=m.poster_url,
-                genres=genres,
-                averageRating=float(m.rat) if m.rat else 0.0,
-                releaseDate=m.release_date,
-            )
-        )
+    total_pages = None
+    if withTotal:
+        total_count = query.count()
+        total_pages = (total_count + size - 1) // size
+
+    facets = genre_facets(db, condition) if withFacets else None
 
-    return {"movies": result, "totalPages": total_pages}
+    score = relevance(keyword, searchType) if sortBy == "RELEVANCE" else None
+    if score is not None:
+        if cursor is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="RELEVANCE sort does not support cursor pagination",
+            )
+        query = query.order_by(desc(score), Movie.mid)
+    elif sortBy == "RATING":
+        sort_key = func.coalesce(Movie.rat, 0)
+        query = query.order_by(desc(sort_key), desc(Movie.mid))
+    else:
+        sort_key = Movie.mid
+        query = query.order_by(Movie.mid)
+
+    if cursor is None:
+        movies = query.offset(page * size).limit(size).all()
+        result = build_movie_items(db, movies)
+        return {"movies": result, "totalPages": total_pages, "facets": facets}
+
+    if cursor:
+        try:
+            key, last_mid = decode_cursor(cursor, 2)
+            last_mid = int(last_mid)
+            if sortBy == "RATING":
+                query = query.filter(
+                    tuple_(sort_key, Movie.mid) < tuple_(Decimal(str(key)), last_mid)
+                )
+            else:
+                query = query.filter(Movie.mid > last_mid)
+        except (ValueError, TypeError, ArithmeticError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Fetch one extra row to know whether another page exists
+    movies = query.limit(size + 1).all()
+    next_cursor = None
+    if len(movies) > size:
+        movies = movies[:size]
+        last = movies[-1]
+        key = (last.rat or 0) if sortBy == "RATING" else last.mid
+        next_cursor = encode_cursor([key, last.mid])
+
+    result = build_movie_items(db, movies)
+    return {
+        "movies": result,
+        "totalPages": total_pages,
+        "nextCursor": next_cursor,
+        "facets": facets,
+    }
+
+
+@router.get("/autocomplete", response_model=List[MovieAutocompleteItem])
+def autocomplete_movies(q: str = "", limit: int = 10, db: Session = Depends(get_db)):
+    """
+    제목/감독 자동완성 (메모리 인덱스, 초성 검색 지원: "ㄱㅅㅊ" -> 기생충)
+    """
+    if not autocomplete_index.loaded:
+        autocomplete_index.build(db)
+    return autocomplete_index.search(q, limit)
 
 
 @router.get("/trend", response_model=List[MovieResponseItem])
-def get_trend_movies(db: Session = Depends(get_db)):
-    # Top 10 by rating
-    movies = db.query(Movie).order_by(desc(Movie.rat)).limit(10).all()
-
-    result = []
-    for m in movies:
-        genres = [g.genre.name for g in m.genres]
-        result.append(
-            MovieResponseItem(
-                id=m.mid,
-                title=m.title,
-                posterUrl=m.poster_url,
-                genres=genres,
-                averageRating=float(m.rat) if m.rat else 0.0,
-                releaseDate=m.release_date,
-            )
+def get_trend_movies(request: Request, db: Session = Depends(get_db)):
+    def build():
+        # Precomputed time-decayed ranking (app/services/trending_service.py)
+        movies = (
+            db.query(Movie)
+            .join(MovieTrend, MovieTrend.mid == Movie.mid)
+            .order_by(MovieTrend.rank)
+            .limit(10)
+            .all()
         )
-    return result
 
+        # Ranking not built yet: top 10 by rating
+        if not movies:
+            movies = db.query(Movie).order_by(desc(Movie.rat).nullslast()).limit(10).all()
 
-@router.get("/detail/{movieId}", response_model=MovieDetailResponse)
-def get_movie_detail(movieId: int, db: Session = Depends(get_db)):
-    movie = db.query(Movie).filter(Movie.mid == movieId).first()
-    if not movie:
-        raise HTTPException(status_code=404, detail="Movie not found")
-
-    genres = [g.genre.name for g in movie.genres]
-
-    return MovieDetailResponse(
-        id=movie.mid,
-        title=movie.title,
-        posterUrl=movie.poster_url,
-        genres=genres,
-        averageRating=float(movie.rat) if movie.rat else 0.0,
-        releaseDate=movie.release_date,
-        description=movie.dec,
+        return build_movie_items(db, movies)
+
+    return conditional_response(
+        request, TREND_CACHE_KEY, TREND_VERSION_KEY, lambda: catalog_version(db), build
     )
 
 
-@router.get("/recommended", response_model=List[MovieResponseItem])
-def get_recommended_movies(limit: int = 4, db: Session = Depends(get_db)):
-    # Random movies with rating >= 3
-    # SQLAlchemy random is tricky across DBs, usually func.random() for PG
-    movies = (
-        db.query(Movie)
-        .filter(Movie.rat >= 3.0)
-        .order_by(func.random())
-        .limit(limit)
-        .all()
+@router.get("/detail/{movieId}", response_model=MovieDetailResponse)
+def get_movie_detail(movieId: int, request: Request, db: Session = Depends(get_db)):
+    def load_version():
+        version = movie_version(db, movieId)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        return version
+
+    def build():
+        movie = db.query(Movie).filter(Movie.mid == movieId).first()
+        if not movie:
+            raise HTTPException(status_code=404, detail="Movie not found")
+
+        genres = load_genre_names(db, [movie.mid])[movie.mid]
+
+        return MovieDetailResponse(
+            id=movie.mid,
+            title=movie.title,
+            posterUrl=movie.poster_url,
+            genres=genres,
+            averageRating=float(movie.rat) if movie.rat else 0.0,
+            releaseDate=movie.release_date,
+            description=movie.dec,
+        )
+
+    return conditional_response(
+        request,
+        detail_cache_key(movieId),
+        detail_version_key(movieId),
+        load_version,
+        build,
     )
 
-    # If not enough rated movies, just random movies
-    if len(movies) < limit:
-        movies = db.query(Movie).order_by(func.random()).limit(limit).all()
-
-    result = []
-    for m in movies:
-        genres = [g.genre.name for g in m.genres]
-        result.append(
-            MovieResponseItem(
-                id=m.mid,
-                title=m.title,
-                posterUrl=m.poster_url,
-                genres=genres,
-                averageRating=float(m.rat) if m.rat else 0.0,
-                releaseDate=m.release_date,
-            )
-        )
-    return result
+
+@router.get("/{movieId}/similar", response_model=List[MovieResponseItem])
+def get_similar_movies(movieId: int, limit: int = 10, db: Session = Depends(get_db)):
+    # Precomputed TF-IDF neighbors (description, director, genres)
+    ids = similar_index.similar(movieId, limit)
+    if not ids:
+        if not db.query(Movie.mid).filter(Movie.mid == movieId).first():
+            raise HTTPException(status_code=404, detail="Movie not found")
+        return []
+
+    return get_movie_cards(db, ids)
+
+
+@router.get("/recommended", response_model=List[MovieResponseItem])
+def get_recommended_movies(
+    limit: int = 4,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional),
+):
+    ids = []
+    if current_user is not None:
+        # Personalized: item-item collaborative filtering top-k
+        ids = recommend_for_user(current_user.uid, limit)
+
+    if len(ids) < limit:
+        # Random movies with rating >= 3, sampled in memory from the candidate pool
+        # (falls back to any movie when there are not enough rated ones)
+        seen = set(ids)
+        ids += [mid for mid in sample_movie_ids(db, limit) if mid not in seen]
+
+    # Cards come from the response cache; only misses hit the database
+    return get_movie_cards(db, ids)[:limit]
@@ -1,46 +1,182 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from app.database import get_db
-from app.models import Review, User
+from sqlalchemy import desc, func, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db, get_async_db
+from app.models import Comment, Review, User
 from app.schemas import (
     ReviewListResponse,
     ReviewListRequest,
     ReviewResponseItem,
     ReviewCreateRequest,
+    ReactionResponse,
+    CommentListResponse,
+    CommentResponseItem,
 )
 from app.dependencies import get_current_user
+from app.config import settings
+from app.services.rating_service import insert_review_with_rating
+from app.services import catalog_events
+from app.services.pagination import encode_cursor, decode_cursor
+from app.services.comment_service import comment_counts
+from app.services import like_service
+from app.services.like_service import COMMENT, DISLIKE, LIKE, REVIEW
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
+FOREIGN_KEY_VIOLATION = "23503"
+
 
 @router.post("/by-movie", response_model=ReviewListResponse)
-def get_reviews_by_movie(req: ReviewListRequest, db: Session = Depends(get_db)):
-    reviews = (
-        db.query(Review)
-        .filter(Review.mid == req.movieId)
-        .order_by(desc(Review.created_at))
-        .all()
+async def get_reviews_by_movie(
+    req: ReviewListRequest, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    영화별 리뷰 목록 (keyset 페이지네이션).
+
+    - `sortBy`: NEWEST(기본), RATING(평점 높은 순), LIKES(좋아요 많은 순)
+      동점은 (created_at, rid) 최신순으로 정렬
+    - 첫 페이지는 `cursor` 없이 요청, 응답의 `nextCursor`를 다음 요청에 그대로 전달
+    - 작성자 닉네임을 같은 쿼리에서 조인, 좋아요 수는 review 의 카운터 컬럼 사용
+    """
+    size = max(1, min(req.size, 100))
+
+    query = (
+        select(
+            Review.rid,
+            Review.uid,
+            Review.rat,
+            Review.dec,
+            Review.created_at,
+            Review.like_count,
+            Review.dislike_count,
+            User.nickname,
+        )
+        .outerjoin(User, User.uid == Review.uid)
+        .where(Review.mid == req.movieId)
     )
 
-    result = []
-    for r in reviews:
-        # Fetch user nickname (r.user.nickname)
-        # Note: r.user might load lazily.
-        # If user is None (shouldn't happen with FK constraint), handle gracefully.
-        nickname = r.user.nickname if r.user else "Unknown"
-
-        result.append(
-            ReviewResponseItem(
-                userId=r.uid,
-                userNickname=nickname,
-                rating=float(r.rat),
-                content=r.dec,
-                createdAt=r.created_at,
+    if req.sortBy == "RATING":
+        sort_key = func.coalesce(Review.rat, 0)
+    elif req.sortBy == "LIKES":
+        sort_key = Review.like_count
+    else:
+        sort_key = None
+    order = [Review.created_at, Review.rid]
+    if sort_key is not None:
+        order.insert(0, sort_key)
+    query = query.order_by(*(desc(col) for col in order))
+
+    if req.cursor:
+        try:
+            values = decode_cursor(req.cursor, len(order))
+            last = [datetime.fromisoformat(values[-2]), int(values[-1])]
+            if sort_key is not None:
+                last.insert(0, Decimal(str(values[0])))
+            query = query.where(tuple_(*order) < tuple_(*last))
+        except (ValueError, TypeError, ArithmeticError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Fetch one extra row to know whether another page exists
+    rows = (await db.execute(query.limit(size + 1))).all()
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        values = [last.created_at.isoformat(), last.rid]
+        if req.sortBy == "RATING":
+            values.insert(0, last.rat or 0)
+        elif req.sortBy == "LIKES":
+            values.insert(0, last.like_count)
+        next_cursor = encode_cursor(values)
+
+    counts = await comment_counts(db, [r.rid for r in rows])
+    result = [
+        ReviewResponseItem(
+            reviewId=r.rid,
+            userId=r.uid,
+            userNickname=r.nickname or "Unknown",
+            rating=float(r.rat) if r.rat is not None else 0.0,
+            content=r.dec,
+            createdAt=r.created_at,
+            likeCount=r.like_count,
+            dislikeCount=r.dislike_count,
+            commentCount=counts.get(r.rid, 0),
+        )
+        for r in rows
+    ]
+
+    return {"reviews": result, "nextCursor": next_cursor}
+
+
+@router.get("/{reviewId}/comments", response_model=CommentListResponse)
+async def get_review_comments(
+    reviewId: int,
+    size: int = 20,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    리뷰 댓글 목록 (오래된 순, keyset 페이지네이션).
+
+    첫 페이지는 `cursor` 없이 요청, 응답의 `nextCursor`를 다음 요청에 그대로 전달.
+    작성자 닉네임은 조인, 좋아요 수는 comment 의 카운터 컬럼으로 한 쿼리에 조회.
+    """
+    size = max(1, min(size, 100))
+    query = (
+        select(
+            Comment.cid,
+            Comment.rid,
+            Comment.uid,
+            Comment.dec,
+            Comment.created_at,
+            Comment.like_count,
+            Comment.dislike_count,
+            User.nickname,
+        )
+        .outerjoin(User, User.uid == Comment.uid)
+        .where(Comment.rid == reviewId)
+        .order_by(Comment.created_at, Comment.cid)
+    )
+
+    if cursor:
+        try:
+            created_at, last_cid = decode_cursor(cursor, 2)
+            query = query.where(
+                tuple_(Comment.created_at, Comment.cid)
+                > tuple_(datetime.fromisoformat(created_at), int(last_cid))
             )
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Fetch one extra row to know whether another page exists
+    rows = (await db.execute(query.limit(size + 1))).all()
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        next_cursor = encode_cursor([last.created_at.isoformat(), last.cid])
+
+    result = [
+        CommentResponseItem(
+            commentId=c.cid,
+            reviewId=c.rid,
+            userId=c.uid,
+            userNickname=c.nickname or "Unknown",
+            content=c.dec,
+            createdAt=c.created_at,
+            likeCount=c.like_count,
+            dislikeCount=c.dislike_count,
         )
+        for c in rows
+    ]
 
-    return {"reviews": result}
+    return {"comments": result, "nextCursor": next_cursor}
 
 
 @router.post("/create")
@@ -49,21 +185,93 @@ def create_review(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    # Check if already reviewed
-    existing = (
-        db.query(Review)
-        .filter(Review.uid == current_user.uid, Review.mid == req.movieId)
-        .first()
-    )
-    if existing:
+    # INSERT ... ON CONFLICT DO NOTHING + rating aggregates in one round trip
+    try:
+        row = insert_review_with_rating(
+            db, current_user.uid, req.movieId, req.content, req.rating
+        )
+    except IntegrityError as e:
+        db.rollback()
+        if getattr(e.orig, "pgcode", None) == FOREIGN_KEY_VIOLATION:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        raise
+    if row is None:
+        db.rollback()
         raise HTTPException(
             status_code=400, detail="You have already reviewed this movie."
         )
 
-    new_review = Review(
-        uid=current_user.uid, mid=req.movieId, dec=req.content, rat=req.rating
+    nickname = current_user.nickname
+    db.commit()
+    catalog_events.invalidate_movie(req.movieId)
+    catalog_events.invalidate_user(nickname)
+
+    review = ReviewResponseItem(
+        reviewId=row.rid,
+        userId=row.uid,
+        userNickname=nickname,
+        rating=float(row.rat) if row.rat is not None else 0.0,
+        content=row.dec,
+        createdAt=row.created_at,
     )
-    db.add(new_review)
+    return {"message": "Review created successfully", "review": review}
+
+
+def _react(db: Session, target, target_id: int, user: User, kind: str):
+    buffered = settings.LIKE_BUFFER_ENABLED
+    try:
+        result = like_service.toggle_reaction(
+            db, target, target_id, user.uid, kind, buffered=buffered
+        )
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Not found")
     db.commit()
+    if buffered:
+        # Only after commit, so the next flush recounts a visible like row
+        like_service.like_buffer.record(target, target_id, result)
+    return {
+        "reaction": result.reaction,
+        "likeCount": result.like_count,
+        "dislikeCount": result.dislike_count,
+    }
+
+
+@router.post("/{reviewId}/like", response_model=ReactionResponse)
+def like_review(
+    reviewId: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """리뷰 좋아요 토글 (다시 누르면 취소, 싫어요 상태면 좋아요로 변경)"""
+    return _react(db, REVIEW, reviewId, current_user, LIKE)
 
-    return {"message": "Review created successfully"}
+
+@router.post("/{reviewId}/dislike", response_model=ReactionResponse)
+def dislike_review(
+    reviewId: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """리뷰 싫어요 토글"""
+    return _react(db, REVIEW, reviewId, current_user, DISLIKE)
+
+
+@router.post("/comments/{commentId}/like", response_model=ReactionResponse)
+def like_comment(
+    commentId: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """댓글 좋아요 토글"""
+    return _react(db, COMMENT, commentId, current_user, LIKE)
+
+
+@router.post("/comments/{commentId}/dislike", response_model=ReactionResponse)
+def dislike_comment(
+    commentId: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """댓글 싫어요 토글"""
+    return _react(db, COMMENT, commentId, current_user, DISLIKE)
@@ -4,14 +4,23 @@ from sqlalchemy import func
 from app.database import get_db
 from app.models import User, Review, Comment, Movie
 from app.schemas import UserDetailResponse, UserDetailReviewItem
+from app.services.cache import render_json
+from app.services.catalog_events import profile_cache_key
+from app.services.shared_cache import shared_cache
+import json
 
 router = APIRouter(prefix="/user", tags=["user"])
 
+# 캐시에는 최대 개수만큼 저장하고 요청한 limit 만큼 잘라서 반환
+PROFILE_MAX_REVIEWS = 100
+
 
 @router.get("/profile/{nickname}", response_model=UserDetailResponse)
 def get_user_profile_by_nickname(
     nickname: str,
-    limit: int = Query(20, ge=1, le=100, description="Number of reviews to return"),
+    limit: int = Query(
+        20, ge=1, le=PROFILE_MAX_REVIEWS, description="Number of reviews to return"
+    ),
     db: Session = Depends(get_db),
 ):
     """
@@ -21,6 +30,16 @@ def get_user_profile_by_nickname(
     - 가입일
     - 지금까지 남긴 리뷰 목록 (기본 20개, 쿼리로 개수 지정 가능)
     """
+    body = shared_cache.get_or_build(
+        profile_cache_key(nickname),
+        lambda: render_json(_build_profile(nickname, db)),
+    )
+    profile = json.loads(body)
+    profile["reviews"] = profile["reviews"][:limit]
+    return profile
+
+
+def _build_profile(nickname: str, db: Session) -> UserDetailResponse:
     # 닉네임으로 사용자 조회
     user = db.query(User).filter(User.nickname == nickname).first()
     if not user:
@@ -36,13 +55,13 @@ def get_user_profile_by_nickname(
         db.query(func.count(Comment.cid)).filter(Comment.uid == user.uid).scalar()
     )
 
-    # 리뷰 목록 조회 (최신순, limit 적용)
+    # 리뷰 목록 조회 (최신순, 최대 PROFILE_MAX_REVIEWS 개)
     reviews = (
         db.query(Review, Movie)
         .join(Movie, Review.mid == Movie.mid)
         .filter(Review.uid == user.uid)
         .order_by(Review.created_at.desc())
-        .limit(limit)
+        .limit(PROFILE_MAX_REVIEWS)
         .all()
     )
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date, datetime
 
 
@@ -61,7 +61,16 @@ class MovieSearchRequest(BaseModel):
 
 class MovieSearchResponse(BaseModel):
     movies: List[MovieResponseItem]
-    totalPages: int
+    totalPages: Optional[int] = None
+    nextCursor: Optional[str] = None
+    facets: Optional[Dict[str, int]] = None  # genre name -> count
+
+
+class MovieAutocompleteItem(BaseModel):
+    id: int
+    title: str
+    director: Optional[str] = None
+    matchedField: str  # TITLE, DIRECTOR
 
 
 # Review Schemas
@@ -72,19 +81,49 @@ class ReviewCreateRequest(BaseModel):
 
 
 class ReviewResponseItem(BaseModel):
+    reviewId: int
     userId: int
     userNickname: str
     rating: float
     content: str
     createdAt: datetime
+    likeCount: int = 0
+    dislikeCount: int = 0
+    commentCount: int = 0
 
 
 class ReviewListResponse(BaseModel):
     reviews: List[ReviewResponseItem]
+    nextCursor: Optional[str] = None
 
 
 class ReviewListRequest(BaseModel):
     movieId: int
+    size: int = 20
+    sortBy: str = "NEWEST"  # NEWEST, RATING, LIKES
+    cursor: Optional[str] = None  # nextCursor of the previous page
+
+
+class CommentResponseItem(BaseModel):
+    commentId: int
+    reviewId: int
+    userId: int
+    userNickname: str
+    content: str
+    createdAt: datetime
+    likeCount: int = 0
+    dislikeCount: int = 0
+
+
+class CommentListResponse(BaseModel):
+    comments: List[CommentResponseItem]
+    nextCursor: Optional[str] = None
+
+
+class ReactionResponse(BaseModel):
+    reaction: Optional[str] = None  # L, D, or null after toggling off
+    likeCount: int
+    dislikeCount: int
 
 
 # User Detail Schemas
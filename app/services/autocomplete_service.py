@@ -0,0 +1,211 @@
+"""
+한글 자모 분해 기반 영화 제목/감독 자동완성 인덱스 (프로세스 메모리)
+
+- "기생ㅊ" 처럼 음절을 입력하는 중인 키워드: 자모 단위로 분해해 prefix 매칭
+  (기생충 -> ㄱㅣㅅㅐㅇㅊㅜㅇ, 겹받침/이중모음도 기본 자모로 풀어서 "달" -> "닭" 매칭)
+- "ㄱㅅㅊ" 처럼 초성만 입력한 키워드: 초성 문자열로 prefix 매칭
+- 단어 시작 위치마다 키를 만들어 "엔드게임" 으로 "어벤져스: 엔드게임" 도 찾는다.
+
+키는 (key, mid) 정렬 리스트에 넣고 bisect 로 prefix 구간을 찾으므로
+DB 없이 메모리에서만 응답한다. 시작 시 한 번 만들고, 관리자 영화 추가/수정/삭제와
+TMDB 가져오기 때 해당 영화만 갱신한다.
+"""
+
+import bisect
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import Movie
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]
+JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ",
+    "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ",
+    "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+# Compound compatibility jamo a user may type directly
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+JAMO_KEY = "j"
+CHOSEONG_KEY = "c"
+WORD_RE = re.compile(r"\w+")
+
+
+def _is_syllable(ch: str) -> bool:
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def decompose(text: str) -> str:
+    """Lowercase and split every Hangul syllable into basic jamo."""
+    out = []
+    for ch in text.lower():
+        if _is_syllable(ch):
+            code = ord(ch) - HANGUL_BASE
+            out.append(CHOSEONG[code // 588])
+            out.append(JUNGSEONG[(code % 588) // 28])
+            out.append(JONGSEONG[code % 28])
+        else:
+            out.append(COMPOUND_JAMO.get(ch, ch))
+    return "".join(out)
+
+
+def choseong(text: str) -> str:
+    """Initial consonants of Hangul syllables; other characters are kept."""
+    return "".join(
+        CHOSEONG[(ord(ch) - HANGUL_BASE) // 588] if _is_syllable(ch) else ch
+        for ch in text.lower()
+    )
+
+
+def is_choseong_query(text: str) -> bool:
+    return bool(text) and all(ch in CHOSEONG for ch in text)
+
+
+def _normalize(text: str) -> str:
+    return "".join(WORD_RE.findall(text))
+
+
+def _keys(text: str) -> List[Tuple[str, int]]:
+    """(key, word position) for jamo and choseong keys at every word start."""
+    words = WORD_RE.findall(text)
+    keys = []
+    for pos in range(len(words)):
+        rest = "".join(words[pos:])
+        keys.append((f"{JAMO_KEY}:{decompose(rest)}", pos))
+        keys.append((f"{CHOSEONG_KEY}:{choseong(rest)}", pos))
+    return keys
+
+
+class AutocompleteIndex:
+    def __init__(self):
+        # Sorted (key, mid, field, word position) entries
+        self.entries: List[Tuple[str, int, str, int]] = []
+        self.movies: Dict[int, Tuple[str, Optional[str]]] = {}
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _movie_entries(mid: int, title: str, director: Optional[str]):
+        entries = [(key, mid, "TITLE", pos) for key, pos in _keys(title)]
+        if director:
+            entries.extend(
+                (key, mid, "DIRECTOR", pos) for key, pos in _keys(director)
+            )
+        return entries
+
+    def build(self, db: Session):
+        entries = []
+        movies = {}
+        for mid, title, director in db.query(Movie.mid, Movie.title, Movie.director):
+            movies[mid] = (title, director)
+            entries.extend(self._movie_entries(mid, title, director))
+        entries.sort()
+        with self._lock:
+            self.entries, self.movies = entries, movies
+            self.loaded = True
+
+    def _remove_locked(self, mid: int):
+        old = self.movies.pop(mid, None)
+        if old is None:
+            return
+        for entry in self._movie_entries(mid, *old):
+            i = bisect.bisect_left(self.entries, entry)
+            if i < len(self.entries) and self.entries[i] == entry:
+                del self.entries[i]
+
+    def upsert(self, mid: int, title: str, director: Optional[str]):
+        with self._lock:
+            self._remove_locked(mid)
+            self.movies[mid] = (title, director)
+            for entry in self._movie_entries(mid, title, director):
+                bisect.insort(self.entries, entry)
+
+    def remove(self, mid: int):
+        with self._lock:
+            self._remove_locked(mid)
+
+    def search(self, query: str, limit: int) -> List[dict]:
+        """
+        Movies whose title or director has a word starting with `query`.
+
+        Matches at the first word rank before matches further in, then
+        shorter titles first.
+        """
+        text = _normalize(query.lower())
+        if not text:
+            return []
+        if is_choseong_query(text):
+            prefix = f"{CHOSEONG_KEY}:{text}"
+        else:
+            prefix = f"{JAMO_KEY}:{decompose(text)}"
+
+        entries = self.entries
+        i = bisect.bisect_left(entries, (prefix,))
+        best: Dict[int, Tuple[int, str]] = {}
+        scanned = 0
+        while i < len(entries) and scanned < limit * 20:
+            key, mid, field, pos = entries[i]
+            if not key.startswith(prefix):
+                break
+            if mid not in best or pos < best[mid][0]:
+                best[mid] = (pos, field)
+            i += 1
+            scanned += 1
+
+        ranked = sorted(
+            (pos, len(self.movies[mid][0]), mid, field)
+            for mid, (pos, field) in best.items()
+            if mid in self.movies
+        )
+
+        return [
+            {
+                "id": mid,
+                "title": self.movies[mid][0],
+                "director": self.movies[mid][1],
+                "matchedField": field,
+            }
+            for _, _, mid, field in ranked[:limit]
+        ]
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+def update_movie(movie_id: int):
+    """Admin write hook: reindex one movie from the database."""
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(Movie.title, Movie.director).filter(Movie.mid == movie_id).first()
+        )
+    finally:
+        db.close()
+    if row is None:
+        autocomplete_index.remove(movie_id)
+    else:
+        autocomplete_index.upsert(movie_id, row.title, row.director)
+
+
+def run_rebuild():
+    """Background job entry point: rebuild the whole index."""
+    db = SessionLocal()
+    try:
+        autocomplete_index.build(db)
+    finally:
+        db.close()
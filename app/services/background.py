@@ -0,0 +1,56 @@
+import asyncio
+from typing import Callable, List, Optional
+
+
+class PeriodicTask:
+    """
+    Run a blocking job in a worker thread every `interval` seconds.
+
+    The first run happens immediately on start. Errors are printed and the
+    loop keeps going, so one failed refresh never stops the schedule.
+    """
+
+    def __init__(self, name: str, interval: float, func: Callable[[], None]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._task: Optional[asyncio.Task] = None
+
+    async def _loop(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.func)
+            except Exception as e:
+                print(f"Error in background task '{self.name}': {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_tasks: List[PeriodicTask] = []
+
+
+def register_task(name: str, interval: float, func: Callable[[], None]):
+    """Register a periodic job; it is started by the app lifespan."""
+    _tasks.append(PeriodicTask(name, interval, func))
+
+
+def start_all():
+    for task in _tasks:
+        task.start()
+
+
+async def stop_all():
+    for task in _tasks:
+        await task.stop()
@@ -0,0 +1,117 @@
+"""
+프로세스 메모리 응답 캐시 (TTL + LRU)
+
+- 항목마다 만료 시간(TTL)을 두고, 개수/바이트 한도를 넘으면 가장 오래 안 쓴 항목부터 제거
+- hit/miss/eviction 카운터는 관리자 API(/api/admin/cache-stats)에서 확인
+- 쓰기 경로(관리자 영화 CRUD, TMDB 가져오기, 리뷰 작성)가 관련 키를 직접 무효화한다.
+  (app/services/catalog_events.py)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (expires_at, size, value), least recently used first
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, _, value = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[float] = None):
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Cached value (treated as immutable)
+            size: Approximate size in bytes, counted against `max_bytes`
+            ttl: Seconds to live (defaults to the cache TTL)
+        """
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            self._data[key] = (expires_at, size, value)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._data))
+                self._pop(oldest)
+                self.evictions += 1
+
+    def _pop(self, key: str):
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+    def invalidate(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                if key in self._data:
+                    self._pop(key)
+
+    def invalidate_prefix(self, prefix: str):
+        with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": self.hits / total if total else 0.0,
+            }
+
+
+response_cache = ResponseCache(
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_MAX_BYTES,
+    ttl=settings.CACHE_TTL_SECONDS,
+)
+
+
+def render_json(content: Any) -> bytes:
+    """Serialize a response payload exactly like FastAPI's JSONResponse."""
+    return JSONResponse(jsonable_encoder(content)).body
+
@@ -0,0 +1,90 @@
+"""
+영화/리뷰 쓰기 후 실행되는 훅
+
+- invalidate_*: 커밋 직후 동기 호출, 응답 캐시에서 바뀐 영화/유저 관련 키를 제거
+  (상세/트렌드 본문은 버전 스탬프별로 캐시되므로 버전 키만 지우면 됨)
+- movie_changed / movie_deleted: BackgroundTasks 로 호출, 메모리 인덱스 갱신
+
+모든 훅은 같은 이벤트를 invalidation_bus 로 NOTIFY 해서 다른 워커도
+자기 프로세스 캐시와 인덱스를 맞춘다 (`_on_remote_event`).
+"""
+
+from app.services import autocomplete_service, invalidation_bus, similar_service
+from app.services.shared_cache import shared_cache
+from app.services.movie_service import (
+    TREND_VERSION_KEY,
+    card_cache_key,
+    detail_version_key,
+)
+
+
+def _invalidate_keys(*keys: str):
+    shared_cache.invalidate(*keys)
+    invalidation_bus.publish({"keys": list(keys)})
+
+
+def invalidate_movie(movie_id: int):
+    """A movie's fields or rating changed."""
+    _invalidate_keys(
+        detail_version_key(movie_id), card_cache_key(movie_id), TREND_VERSION_KEY
+    )
+
+
+def invalidate_trend():
+    """The trending ranking was rebuilt."""
+    _invalidate_keys(TREND_VERSION_KEY)
+
+
+def invalidate_catalog():
+    """Many movies may have changed (e.g. a user and all their reviews deleted)."""
+    shared_cache.invalidate_prefix("movies:")
+    invalidation_bus.publish({"prefixes": ["movies:"]})
+
+
+def profile_cache_key(nickname: str) -> str:
+    return f"user:profile:{nickname}"
+
+
+def invalidate_user(*nicknames: str):
+    """A user's profile, reviews or comments changed."""
+    _invalidate_keys(*(profile_cache_key(n) for n in nicknames))
+
+
+def _update_indexes(movie_id: int):
+    similar_service.update_movie(movie_id)
+    autocomplete_service.update_movie(movie_id)
+
+
+def movie_changed(movie_id: int):
+    _update_indexes(movie_id)
+    invalidation_bus.publish({"changed": [movie_id]})
+
+
+def movie_deleted(movie_id: int):
+    autocomplete_service.autocomplete_index.remove(movie_id)
+    invalidation_bus.publish({"deleted": [movie_id]})
+
+
+def _on_remote_event(event: dict):
+    """
+    Apply an event from another worker.
+
+    Shared Redis keys were already deleted by the sender, so only this
+    process's tiers are evicted here.
+    """
+    if event.get("flush"):
+        shared_cache.clear_local()
+        return
+    keys = event.get("keys", [])
+    if keys:
+        shared_cache.evict_local(*keys)
+    for prefix in event.get("prefixes", []):
+        shared_cache.evict_local_prefix(prefix)
+    for movie_id in event.get("changed", []):
+        _update_indexes(movie_id)
+    for movie_id in event.get("deleted", []):
+        autocomplete_service.autocomplete_index.remove(movie_id)
+
+
+invalidation_bus.subscribe(_on_remote_event)
+invalidation_bus.on_reconnect(shared_cache.clear_local)
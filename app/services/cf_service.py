@@ -0,0 +1,141 @@
+"""
+아이템-아이템 협업 필터링 (item-item collaborative filtering)
+
+review 테이블의 (유저 x 영화) 평점 행렬로 영화 간 코사인 유사도를 계산하고,
+영화마다 상위 `CF_NEIGHBORS` 개 이웃만 압축 배열로 메모리에 유지한다.
+모델은 백그라운드 작업에서 다시 만들어 통째로 교체하므로, 요청 처리는
+유저가 평가한 영화들의 이웃 점수를 더해 top-k 를 고르는 작업뿐이다.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Review
+
+# Items per block when multiplying the similarity matrix
+BLOCK_SIZE = 2048
+
+
+class ItemSimilarityModel:
+    def __init__(
+        self,
+        item_ids: np.ndarray,
+        user_index: Dict[int, int],
+        user_items: sparse.csr_matrix,
+        neighbors: np.ndarray,
+        weights: np.ndarray,
+    ):
+        self.item_ids = item_ids  # column -> movie id
+        self.user_index = user_index  # user id -> row
+        self.user_items = user_items  # users x items ratings (CSR)
+        self.neighbors = neighbors  # items x K neighbor columns (-1 = empty)
+        self.weights = weights  # items x K cosine similarities
+
+    def recommend(self, user_id: int, limit: int) -> List[int]:
+        """
+        Top `limit` unseen movie ids for a user, best first.
+
+        Returns an empty list for users without rated reviews.
+        """
+        row = self.user_index.get(user_id)
+        if row is None:
+            return []
+
+        start, end = self.user_items.indptr[row], self.user_items.indptr[row + 1]
+        items = self.user_items.indices[start:end]
+        ratings = self.user_items.data[start:end]
+
+        neighbors = self.neighbors[items]
+        weights = self.weights[items] * ratings[:, None]
+        mask = neighbors >= 0
+        scores = np.bincount(
+            neighbors[mask], weights=weights[mask], minlength=len(self.item_ids)
+        )
+        scores[items] = 0  # never recommend what the user already reviewed
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > limit:
+            top = np.argpartition(scores[candidates], -limit)[-limit:]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return self.item_ids[candidates].tolist()
+
+
+def build_model(db: Session, k: int) -> Optional[ItemSimilarityModel]:
+    """
+    Build the item-item model from every rated review.
+
+    Args:
+        db: Database session
+        k: Number of neighbors kept per movie
+
+    Returns:
+        The model, or None if there are no rated reviews yet
+    """
+    rows = db.query(Review.uid, Review.mid, Review.rat).filter(
+        Review.rat.isnot(None)
+    )
+    data = np.array([(uid, mid, float(rat)) for uid, mid, rat in rows])
+    if len(data) == 0:
+        return None
+
+    user_ids, user_rows = np.unique(data[:, 0].astype(np.int64), return_inverse=True)
+    item_ids, item_cols = np.unique(data[:, 1].astype(np.int64), return_inverse=True)
+    ratings = data[:, 2].astype(np.float32)
+
+    user_items = sparse.csr_matrix(
+        (ratings, (user_rows, item_cols)), shape=(len(user_ids), len(item_ids))
+    )
+
+    # Column-normalize so X.T @ X is the cosine similarity between movies
+    norms = np.sqrt(np.asarray(user_items.multiply(user_items).sum(axis=0))).ravel()
+    norms[norms == 0] = 1
+    x = (user_items @ sparse.diags(1 / norms)).tocsc()
+    xt = x.T.tocsr()
+
+    n_items = len(item_ids)
+    neighbors = np.full((n_items, k), -1, dtype=np.int32)
+    weights = np.zeros((n_items, k), dtype=np.float32)
+    for block_start in range(0, n_items, BLOCK_SIZE):
+        block = (xt[block_start : block_start + BLOCK_SIZE] @ x).tocsr()
+        for offset in range(block.shape[0]):
+            item = block_start + offset
+            start, end = block.indptr[offset], block.indptr[offset + 1]
+            cols = block.indices[start:end]
+            sims = block.data[start:end]
+            keep = cols != item
+            cols, sims = cols[keep], sims[keep]
+            if len(cols) > k:
+                top = np.argpartition(sims, -k)[-k:]
+                cols, sims = cols[top], sims[top]
+            neighbors[item, : len(cols)] = cols
+            weights[item, : len(cols)] = sims
+
+    user_index = {int(uid): row for row, uid in enumerate(user_ids)}
+    return ItemSimilarityModel(item_ids, user_index, user_items, neighbors, weights)
+
+
+_model: Optional[ItemSimilarityModel] = None
+
+
+def recommend_for_user(user_id: int, limit: int) -> List[int]:
+    """Personalized movie ids from the current model ([] until it is built)."""
+    model = _model
+    if model is None:
+        return []
+    return model.recommend(user_id, limit)
+
+
+def run_rebuild():
+    """Background job entry point: rebuild the model and swap it in."""
+    global _model
+    db = SessionLocal()
+    try:
+        _model = build_model(db, settings.CF_NEIGHBORS)
+    finally:
+        db.close()
@@ -0,0 +1,29 @@
+from typing import Dict, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Comment
+
+
+async def comment_counts(db: AsyncSession, review_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    Count comments for a page of reviews in a single query.
+
+    Args:
+        db: Async database session
+        review_ids: Review ids on the page
+
+    Returns:
+        Mapping of review id -> comment count (reviews without comments are absent)
+    """
+    ids = list(set(review_ids))
+    if not ids:
+        return {}
+
+    rows = await db.execute(
+        select(Comment.rid, func.count(Comment.cid))
+        .where(Comment.rid.in_(ids))
+        .group_by(Comment.rid)
+    )
+    return dict(rows.all())
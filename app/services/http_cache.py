@@ -0,0 +1,103 @@
+"""
+HTTP 조건부 요청 (ETag / Last-Modified / 304)
+
+본문 대신 싼 버전 스탬프(영화 updated_at, 카탈로그 버전)로 강한 ETag 를 만든다.
+클라이언트/CDN 이 같은 ETag 로 재검증하면 본문을 만들거나 직렬화하지 않고 304 를 준다.
+
+- 버전 스탬프 자체도 shared_cache 에 캐시 (쓰기 시 catalog_events 가 무효화)
+- 본문은 `{key}@{etag}` 로 캐시해서, 스탬프와 본문이 서로 다른 버전이 되지 않게 함
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.config import settings
+from app.services.shared_cache import cached_response, shared_cache
+
+Version = Tuple[str, Optional[datetime]]
+
+
+def cache_control() -> str:
+    return (
+        f"public, max-age={settings.HTTP_MAX_AGE_SECONDS}, "
+        f"stale-while-revalidate={settings.HTTP_STALE_WHILE_REVALIDATE_SECONDS}"
+    )
+
+
+def _load_version(
+    version_key: str, load_version: Callable[[], Version]
+) -> Version:
+    def build() -> bytes:
+        stamp, last_modified = load_version()
+        token = hashlib.sha1(stamp.encode()).hexdigest()[:20]
+        return json.dumps(
+            [token, last_modified.isoformat() if last_modified else None]
+        ).encode()
+
+    token, last_modified = json.loads(shared_cache.get_or_build(version_key, build))
+    return token, datetime.fromisoformat(last_modified) if last_modified else None
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2)
+    candidates = [c.strip().removeprefix("W/") for c in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional_response(
+    request: Request,
+    key: str,
+    version_key: str,
+    load_version: Callable[[], Version],
+    build: Callable[[], object],
+) -> Response:
+    """
+    Serve a cached JSON payload with ETag/Last-Modified/Cache-Control headers.
+
+    Args:
+        request: Incoming request (If-None-Match / If-Modified-Since)
+        key: Base cache key of the payload
+        version_key: Cache key of the version stamp
+        load_version: Returns (stamp, last_modified); may raise HTTPException
+        build: Builds the payload on a cache miss
+
+    Returns:
+        304 without a body if the client's copy is current, otherwise 200
+    """
+    token, last_modified = _load_version(version_key, load_version)
+    etag = f'"{token}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control()}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    elif if_modified_since is not None and last_modified is not None:
+        not_modified = _not_modified_since(if_modified_since, last_modified)
+    else:
+        not_modified = False
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    response = cached_response(f"{key}@{token}", build)
+    response.headers.update(headers)
+    return response
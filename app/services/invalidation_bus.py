@@ -0,0 +1,166 @@
+"""
+워커 간 캐시 무효화 버스 (PostgreSQL LISTEN/NOTIFY)
+
+uvicorn 워커마다 프로세스 메모리 캐시(L1, 로컬 응답 캐시)와 메모리 인덱스
+(자동완성, 유사 영화)를 따로 가진다. 한 워커에서 관리자/리뷰 쓰기가 일어나면
+`publish()` 가 이벤트를 NOTIFY 하고, 각 워커의 `listener` 스레드가 받아서
+등록된 핸들러(app/services/catalog_events.py)로 넘긴다.
+
+- 자기 자신이 보낸 이벤트는 무시 (보낸 쪽은 이미 로컬에서 처리함)
+- 연결이 끊겼다가 다시 붙으면 그 사이 이벤트를 놓쳤을 수 있으므로
+  `on_reconnect` 핸들러로 로컬 캐시를 전부 비운다
+"""
+
+import json
+import select
+import threading
+import uuid
+from typing import Callable, List, Optional
+
+import psycopg2
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import engine
+
+# 이 프로세스를 구분하는 ID, 자기 이벤트 무시에 사용
+WORKER_ID = uuid.uuid4().hex
+
+# NOTIFY payload 최대 길이는 8000 bytes
+MAX_PAYLOAD_BYTES = 7900
+
+POLL_TIMEOUT = 1.0
+
+_handlers: List[Callable[[dict], None]] = []
+_reconnect_handlers: List[Callable[[], None]] = []
+
+
+def subscribe(handler: Callable[[dict], None]):
+    """Register a handler for events published by other workers."""
+    _handlers.append(handler)
+
+
+def on_reconnect(handler: Callable[[], None]):
+    """Register a handler run when the listener (re)connects."""
+    _reconnect_handlers.append(handler)
+
+
+def publish(event: dict):
+    """
+    NOTIFY other workers about `event`.
+
+    Failures are printed and swallowed: the write already committed and local
+    caches are already evicted, other workers fall back to their short TTLs.
+    """
+    if not settings.INVALIDATION_BUS_ENABLED:
+        return
+    payload = json.dumps({**event, "origin": WORKER_ID}, separators=(",", ":"))
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        payload = json.dumps({"flush": True, "origin": WORKER_ID})
+    try:
+        with engine.connect() as conn:
+            conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": settings.INVALIDATION_CHANNEL, "payload": payload},
+            )
+            conn.commit()
+    except Exception as e:
+        print(f"Error publishing invalidation event: {e}")
+
+
+def _dispatch(payload: str):
+    try:
+        event = json.loads(payload)
+    except ValueError:
+        print(f"Error decoding invalidation event: {payload!r}")
+        return
+    if event.get("origin") == WORKER_ID:
+        return
+    for handler in _handlers:
+        try:
+            handler(event)
+        except Exception as e:
+            print(f"Error handling invalidation event: {e}")
+
+
+class InvalidationListener:
+    """
+    LISTEN on the invalidation channel in a daemon thread.
+
+    Uses a dedicated psycopg2 connection (not from the pool) in autocommit mode.
+    On connection errors it waits `INVALIDATION_RECONNECT_SECONDS` and
+    reconnects; every (re)connect runs the `on_reconnect` handlers.
+    """
+
+    def __init__(self):
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.received = 0
+        self.reconnects = 0
+
+    def _connect(self):
+        url = engine.url
+        conn = psycopg2.connect(
+            host=url.host,
+            port=url.port,
+            user=url.username,
+            password=url.password,
+            dbname=url.database,
+        )
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(f'LISTEN "{settings.INVALIDATION_CHANNEL}"')
+        return conn
+
+    def _listen(self, conn):
+        while not self._stop.is_set():
+            if select.select([conn], [], [], POLL_TIMEOUT) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                self.received += 1
+                _dispatch(notify.payload)
+
+    def _run(self):
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                for handler in _reconnect_handlers:
+                    handler()
+                self._listen(conn)
+            except Exception as e:
+                print(f"Error in invalidation listener: {e}")
+                self.reconnects += 1
+                self._stop.wait(settings.INVALIDATION_RECONNECT_SECONDS)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+    def start(self):
+        if not settings.INVALIDATION_BUS_ENABLED or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="invalidation-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=POLL_TIMEOUT * 2)
+        self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.INVALIDATION_BUS_ENABLED,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+
+listener = InvalidationListener()
@@ -0,0 +1,349 @@
+"""
+리뷰/댓글 좋아요·싫어요와 like_count/dislike_count 카운터
+
+좋아요 행(review_like, comment_like)이 원본이고 카운터는 파생 값이다.
+
+- LIKE_BUFFER_ENABLED=false: 토글과 같은 트랜잭션에서 카운터를 UPDATE
+- LIKE_BUFFER_ENABLED=true (write-behind): 토글은 좋아요 행만 쓰고, 바뀐 리뷰/댓글
+  id 를 메모리 버퍼에 모아 두었다가 `run_flush` 가 N초마다 한 번의 UPDATE 로
+  좋아요 행에서 다시 센다. 재계산이라 여러 번 flush 해도, 여러 워커가 동시에
+  flush 해도 값이 틀어지지 않는다.
+- 워커가 flush 전에 죽으면 버퍼가 사라지므로 `run_reconcile` 이 최근에 바뀐
+  좋아요 행(updated_at)의 대상을 주기적으로 다시 센다. 취소도 행을 지우지 않고
+  type 을 NULL 로 바꿔서 updated_at 이 남는다.
+"""
+
+import threading
+from datetime import timedelta
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Comment, CommentLike, Review, ReviewLike
+
+LIKE = "L"
+DISLIKE = "D"
+
+
+class ReactionTarget(NamedTuple):
+    """A likeable table, its reaction table and the column linking them."""
+
+    owner: type
+    like_model: type
+    key: str
+
+
+REVIEW = ReactionTarget(Review, ReviewLike, "rid")
+COMMENT = ReactionTarget(Comment, CommentLike, "cid")
+TARGETS = (REVIEW, COMMENT)
+
+
+class ReactionResult(NamedTuple):
+    reaction: Optional[str]  # current reaction of the user, None if none
+    like_count: int
+    dislike_count: int
+    like_delta: int
+    dislike_delta: int
+
+
+def _deltas(old: Optional[str], new: Optional[str]) -> Tuple[int, int]:
+    like = (new == LIKE) - (old == LIKE)
+    dislike = (new == DISLIKE) - (old == DISLIKE)
+    return like, dislike
+
+
+def _upsert_reaction(
+    db: Session, target: ReactionTarget, target_id: int, user_id: int, kind: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Toggle the reaction row of one user.
+
+    Clicking the current reaction again clears it (type = NULL, the row is
+    kept), clicking the other one switches it (INSERT ... ON CONFLICT DO
+    UPDATE). A transaction-level
+    advisory lock on (table, target, user) serializes concurrent clicks by the
+    same user, so the counters always see the true old/new reaction.
+
+    Returns:
+        (old reaction, new reaction); None means no reaction
+    """
+    like = target.like_model
+    key = getattr(like, target.key)
+
+    lock_key = f"{like.__tablename__}:{target_id}:{user_id}"
+    db.execute(select(func.pg_advisory_xact_lock(func.hashtext(lock_key))))
+
+    old = db.execute(
+        select(like.type).where(key == target_id, like.uid == user_id)
+    ).scalar()
+    new = None if old == kind else kind
+    db.execute(
+        insert(like)
+        .values({target.key: target_id, "uid": user_id, "type": new})
+        .on_conflict_do_update(
+            index_elements=[key, like.uid],
+            set_={"type": new, "updated_at": func.now()},
+        )
+    )
+    return old, new
+
+
+def toggle_reaction(
+    db: Session,
+    target: ReactionTarget,
+    target_id: int,
+    user_id: int,
+    kind: str,
+    buffered: bool = False,
+) -> ReactionResult:
+    """
+    Toggle a like/dislike of one user.
+
+    Without `buffered` the owner's counters are updated in the same
+    transaction. With `buffered` they are only read, and the returned counts
+    include this worker's unflushed deltas; the caller must pass the result to
+    `like_buffer.record` after committing.
+
+    Args:
+        db: Database session (the caller commits)
+        target: REVIEW or COMMENT
+        target_id: Review or comment id
+        user_id: Reacting user
+        kind: LIKE or DISLIKE
+        buffered: Defer the counter update to the write-behind buffer
+
+    Raises:
+        sqlalchemy.exc.IntegrityError: If the review/comment does not exist
+    """
+    old, new = _upsert_reaction(db, target, target_id, user_id, kind)
+    like_delta, dislike_delta = _deltas(old, new)
+
+    owner = target.owner
+    pk = getattr(owner, target.key)
+    if buffered:
+        like_count, dislike_count = db.execute(
+            select(owner.like_count, owner.dislike_count).where(pk == target_id)
+        ).one()
+        pending_like, pending_dislike = like_buffer.pending(target, target_id)
+        like_count += pending_like + like_delta
+        dislike_count += pending_dislike + dislike_delta
+    else:
+        like_count, dislike_count = db.execute(
+            update(owner)
+            .where(pk == target_id)
+            .values(
+                like_count=owner.like_count + like_delta,
+                dislike_count=owner.dislike_count + dislike_delta,
+            )
+            .returning(owner.like_count, owner.dislike_count)
+            .execution_options(synchronize_session=False)
+        ).one()
+    return ReactionResult(
+        new, max(like_count, 0), max(dislike_count, 0), like_delta, dislike_delta
+    )
+
+
+def recount(db: Session, target: ReactionTarget, ids: List[int]) -> int:
+    """
+    Recompute the counters of the given reviews/comments from their like rows.
+
+    One UPDATE for the whole batch; ids without any reaction get zero.
+    """
+    if not ids:
+        return 0
+    owner = target.owner.__tablename__
+    likes = target.like_model.__tablename__
+    key = target.key
+    result = db.execute(
+        text(
+            f"""
+            UPDATE {owner} AS o
+            SET like_count = t.likes, dislike_count = t.dislikes
+            FROM (
+                SELECT d.id,
+                       count(*) FILTER (WHERE l.type = 'L') AS likes,
+                       count(*) FILTER (WHERE l.type = 'D') AS dislikes
+                FROM unnest(CAST(:ids AS integer[])) AS d(id)
+                LEFT JOIN {likes} AS l ON l.{key} = d.id
+                GROUP BY d.id
+            ) AS t
+            WHERE o.{key} = t.id
+            """
+        ),
+        {"ids": sorted(ids)},
+    )
+    return result.rowcount
+
+
+class LikeCounterBuffer:
+    """
+    Per-worker write-behind buffer of counter changes.
+
+    Keeps the touched ids (flushed by recounting, see module docstring) and
+    their pending deltas (only used to show up-to-date counts in responses
+    before the flush).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[ReactionTarget, Dict[int, List[int]]] = {
+            target: {} for target in TARGETS
+        }
+        self.recorded = 0
+        self.flushes = 0
+        self.flushed_rows = 0
+
+    def record(self, target: ReactionTarget, target_id: int, result: ReactionResult):
+        with self._lock:
+            delta = self._pending[target].setdefault(target_id, [0, 0])
+            delta[0] += result.like_delta
+            delta[1] += result.dislike_delta
+            self.recorded += 1
+
+    def pending(self, target: ReactionTarget, target_id: int) -> Tuple[int, int]:
+        with self._lock:
+            delta = self._pending[target].get(target_id)
+            return (delta[0], delta[1]) if delta else (0, 0)
+
+    def _take(self) -> Dict[ReactionTarget, Set[int]]:
+        with self._lock:
+            taken = {target: set(ids) for target, ids in self._pending.items()}
+            self._pending = {target: {} for target in TARGETS}
+            return taken
+
+    def _restore(self, taken: Dict[ReactionTarget, Set[int]]):
+        # Deltas of a failed flush are lost, but the ids are retried
+        with self._lock:
+            for target, ids in taken.items():
+                for target_id in ids:
+                    self._pending[target].setdefault(target_id, [0, 0])
+
+    def flush(self) -> int:
+        """Recount every touched review/comment in one transaction."""
+        taken = self._take()
+        if not any(taken.values()):
+            return 0
+        db = SessionLocal()
+        try:
+            rows = sum(recount(db, target, list(ids)) for target, ids in taken.items())
+            db.commit()
+        except Exception:
+            db.rollback()
+            self._restore(taken)
+            raise
+        finally:
+            db.close()
+        self.flushes += 1
+        self.flushed_rows += rows
+        return rows
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = sum(len(ids) for ids in self._pending.values())
+        return {
+            "enabled": settings.LIKE_BUFFER_ENABLED,
+            "pending": pending,
+            "recorded": self.recorded,
+            "flushes": self.flushes,
+            "flushedRows": self.flushed_rows,
+        }
+
+
+like_buffer = LikeCounterBuffer()
+
+
+def run_flush():
+    """Background job entry point: flush the write-behind buffer."""
+    like_buffer.flush()
+
+
+def reconcile_recent(db: Session, seconds: float) -> int:
+    """Recount the targets of like rows changed in the last `seconds` seconds."""
+    rows = 0
+    for target in TARGETS:
+        like = target.like_model
+        key = getattr(like, target.key)
+        ids = db.execute(
+            select(key)
+            .where(like.updated_at >= func.now() - timedelta(seconds=seconds))
+            .distinct()
+        ).scalars().all()
+        rows += recount(db, target, list(ids))
+    return rows
+
+
+def run_reconcile():
+    """
+    Background job entry point: repair counters lost by a crashed worker.
+
+    Looks back two reconcile periods so a crash right after one run is still
+    covered by the next.
+    """
+    db = SessionLocal()
+    try:
+        reconcile_recent(db, settings.LIKE_RECONCILE_SECONDS * 2)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _reaction_totals(target: ReactionTarget, user_id: Optional[int] = None):
+    like = target.like_model
+    key = getattr(like, target.key)
+    query = select(
+        key.label("id"),
+        func.count().filter(like.type == LIKE).label("likes"),
+        func.count().filter(like.type == DISLIKE).label("dislikes"),
+    )
+    if user_id is not None:
+        query = query.where(like.uid == user_id)
+    return query.group_by(key).subquery()
+
+
+def remove_user_reactions(db: Session, user_id: int) -> None:
+    """Subtract a user's reactions from the counters, e.g. before deleting the user."""
+    for target in (REVIEW, COMMENT):
+        owner = target.owner
+        totals = _reaction_totals(target, user_id)
+        db.execute(
+            update(owner)
+            .where(getattr(owner, target.key) == totals.c.id)
+            .values(
+                like_count=owner.like_count - totals.c.likes,
+                dislike_count=owner.dislike_count - totals.c.dislikes,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def backfill_like_counts(db: Session) -> int:
+    """
+    Recompute like_count/dislike_count of reviews and comments from the like rows.
+
+    Returns:
+        Number of reviews and comments that have at least one reaction
+    """
+    updated = 0
+    for target in (REVIEW, COMMENT):
+        owner = target.owner
+        totals = _reaction_totals(target)
+        db.execute(
+            update(owner)
+            .values(like_count=0, dislike_count=0)
+            .execution_options(synchronize_session=False)
+        )
+        result = db.execute(
+            update(owner)
+            .where(getattr(owner, target.key) == totals.c.id)
+            .values(like_count=totals.c.likes, dislike_count=totals.c.dislikes)
+            .execution_options(synchronize_session=False)
+        )
+        updated += result.rowcount
+    return updated
@@ -0,0 +1,137 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import Movie, MovieGenre, MovieTrend, Genre
+from app.schemas import MovieResponseItem
+from app.services.cache import response_cache
+
+TREND_CACHE_KEY = "movies:trend"
+TREND_VERSION_KEY = "movies:trend:version"
+
+
+def detail_cache_key(movie_id: int) -> str:
+    return f"movies:detail:{movie_id}"
+
+
+def detail_version_key(movie_id: int) -> str:
+    return f"movies:detail:{movie_id}:version"
+
+
+def card_cache_key(movie_id: int) -> str:
+    return f"movies:card:{movie_id}"
+
+
+def movie_version(
+    db: Session, movie_id: int
+) -> Optional[Tuple[str, Optional[datetime]]]:
+    """
+    Cheap version stamp of one movie (primary key lookup of `updated_at`).
+
+    Returns:
+        (stamp, last_modified), or None if the movie does not exist
+    """
+    row = db.query(Movie.updated_at).filter(Movie.mid == movie_id).first()
+    if row is None:
+        return None
+    updated_at = row[0]
+    return f"{movie_id}:{updated_at.timestamp() if updated_at else 0}", updated_at
+
+
+def catalog_version(db: Session) -> Tuple[str, Optional[datetime]]:
+    """
+    Version stamp of the whole catalog, used for catalog-wide payloads (trend).
+
+    Changes when any movie is updated, rated or added, when a ranked movie is
+    deleted (its movie_trend row cascades away), or when the trending ranking
+    is rebuilt. max(updated_at) is read from ix_movie_updated_at; only the
+    small movie_trend table is counted.
+    """
+    movie_updated = db.query(func.max(Movie.updated_at)).scalar()
+    trend_updated, trend_count = db.query(
+        func.max(MovieTrend.updated_at), func.count(MovieTrend.rank)
+    ).one()
+    stamps = [t for t in (movie_updated, trend_updated) if t is not None]
+    last_modified = max(stamps) if stamps else None
+    parts = [t.timestamp() if t else 0 for t in (movie_updated, trend_updated)]
+    return f"{trend_count}:{parts[0]}:{parts[1]}", last_modified
+
+
+def load_genre_names(db: Session, movie_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """
+    Fetch genre names for a batch of movies in a single query.
+
+    Args:
+        db: Database session
+        movie_ids: Movie ids to load genres for
+
+    Returns:
+        Mapping of movie id -> list of genre names (missing ids map to [])
+    """
+    ids = list(set(movie_ids))
+    genres: Dict[int, List[str]] = defaultdict(list)
+    if not ids:
+        return genres
+
+    rows = (
+        db.query(MovieGenre.mid, Genre.name)
+        .join(Genre, MovieGenre.gid == Genre.gid)
+        .filter(MovieGenre.mid.in_(ids))
+        .order_by(MovieGenre.mid, Genre.gid)
+        .all()
+    )
+    for mid, name in rows:
+        genres[mid].append(name)
+    return genres
+
+
+def to_movie_item(movie: Movie, genres: List[str]) -> MovieResponseItem:
+    return MovieResponseItem(
+        id=movie.mid,
+        title=movie.title,
+        posterUrl=movie.poster_url,
+        genres=genres,
+        averageRating=float(movie.rat) if movie.rat else 0.0,
+        releaseDate=movie.release_date,
+    )
+
+
+def build_movie_items(db: Session, movies: List[Movie]) -> List[MovieResponseItem]:
+    """
+    Convert a page of movies into MovieResponseItem cards.
+
+    Genres for the whole page are loaded with one batched query instead of
+    touching the lazy `Movie.genres` relationship per movie.
+    """
+    genres = load_genre_names(db, (m.mid for m in movies))
+    return [to_movie_item(m, genres[m.mid]) for m in movies]
+
+
+def get_movie_cards(db: Session, movie_ids: List[int]) -> List[MovieResponseItem]:
+    """
+    Movie cards for the given ids, in the same order, served from the cache.
+
+    Misses are loaded with one movie query plus one genre query and cached.
+    Ids of movies that no longer exist are skipped.
+    """
+    cards: Dict[int, MovieResponseItem] = {}
+    missing = []
+    for mid in movie_ids:
+        card = response_cache.get(card_cache_key(mid))
+        if card is None:
+            missing.append(mid)
+        else:
+            cards[mid] = card
+
+    if missing:
+        movies = db.query(Movie).filter(Movie.mid.in_(missing)).all()
+        for card in build_movie_items(db, movies):
+            cards[card.id] = card
+            response_cache.set(
+                card_cache_key(card.id), card, size=len(card.model_dump_json())
+            )
+
+    return [cards[mid] for mid in movie_ids if mid in cards]
@@ -0,0 +1,114 @@
+"""
+bcrypt 해싱/검증을 이벤트 루프 밖 전용 스레드 풀에서 실행
+
+bcrypt(rounds=12)는 호출당 수백 ms 동안 CPU 를 쓰므로 async 핸들러에서 직접 부르면
+그 워커의 다른 요청이 모두 멈춘다. bcrypt 는 해싱 중 GIL 을 놓기 때문에 스레드 풀로
+충분하다.
+
+- 동시 실행 수: PASSWORD_HASH_WORKERS
+- 대기열: PASSWORD_HASH_QUEUE_SIZE 를 넘으면 PasswordHasherBusy (라우터에서 503)
+- 대기 시간/해싱 시간 통계는 관리자 API(/api/admin/auth-stats)에서 확인
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from app.config import settings
+from app.utils import get_password_hash, percentile_ms, verify_password
+
+T = TypeVar("T")
+
+# Recent samples kept for percentiles
+SAMPLE_SIZE = 1024
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full."""
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._waits = deque(maxlen=SAMPLE_SIZE)
+        self._runs = deque(maxlen=SAMPLE_SIZE)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="bcrypt"
+                )
+            return self._executor
+
+    async def _submit(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._in_flight >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self._in_flight += 1
+
+        submitted = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self._waits.append(started - submitted)
+                    self._runs.append(finished - started)
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), timed)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits, runs = list(self._waits), list(self._runs)
+            return {
+                "workers": self.workers,
+                "queueSize": self.queue_size,
+                "inFlight": self._in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "queueWaitMs": {
+                    "p50": percentile_ms(waits, 0.5),
+                    "p99": percentile_ms(waits, 0.99),
+                },
+                "hashMs": {
+                    "p50": percentile_ms(runs, 0.5),
+                    "p99": percentile_ms(runs, 0.99),
+                },
+            }
+
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE
+)
@@ -0,0 +1,77 @@
+"""
+인증된 유저(principal) 캐시
+
+get_current_user 는 매 요청마다 토큰의 sub(email)로 users 를 조회했다.
+조회 결과의 컬럼 값(비밀번호 해시 제외)을 email 키로 짧은 TTL 동안 프로세스 메모리에
+두고, 히트면 DB 를 거치지 않는다.
+
+- TTL: PRINCIPAL_CACHE_TTL_SECONDS (관리자 권한 변경 등 DB 직접 수정도 이 시간 안에 반영)
+- 관리자 update_user/delete_user 는 `invalidate` 로 즉시 지우고, invalidation_bus 로
+  다른 워커에도 알린다.
+- 캐시에서 꺼낼 때마다 새 (세션에 붙지 않은) User 객체를 만들어 돌려주므로 요청끼리
+  객체를 공유하지 않는다. 관계(reviews, comments) 지연 로딩은 안 된다.
+"""
+
+from typing import Optional
+
+from app.config import settings
+from app.models import User
+from app.services import invalidation_bus
+from app.services.cache import ResponseCache
+
+# Columns kept in the cache; the password hash never is
+PRINCIPAL_COLUMNS = [c.key for c in User.__table__.columns if c.key != "password"]
+
+# Rough per-entry size, only used for the byte limit of ResponseCache
+ENTRY_SIZE = 512
+
+
+def principal_cache_key(email: str) -> str:
+    return f"principal:{email}"
+
+
+class PrincipalCache:
+    def __init__(self, max_entries: int, ttl: float):
+        self._cache = ResponseCache(
+            max_entries=max_entries, max_bytes=max_entries * ENTRY_SIZE, ttl=ttl
+        )
+
+    def get(self, email: str) -> Optional[User]:
+        values = self._cache.get(principal_cache_key(email))
+        if values is None:
+            return None
+        return User(**values)
+
+    def set(self, user: User):
+        values = {column: getattr(user, column) for column in PRINCIPAL_COLUMNS}
+        self._cache.set(principal_cache_key(user.email), values, ENTRY_SIZE)
+
+    def evict_local(self, *emails: str):
+        self._cache.invalidate(*(principal_cache_key(e) for e in emails))
+
+    def invalidate(self, *emails: str):
+        """Drop the principals here and on every other worker."""
+        self.evict_local(*emails)
+        invalidation_bus.publish({"principals": list(emails)})
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def _on_remote_event(event: dict):
+    emails = event.get("principals", [])
+    if emails:
+        principal_cache.evict_local(*emails)
+
+
+invalidation_bus.subscribe(_on_remote_event)
+invalidation_bus.on_reconnect(principal_cache.clear)
@@ -0,0 +1,155 @@
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.models import Movie, Review
+
+
+def _rating_values(new_sum, new_count) -> dict:
+    return {
+        Movie.rating_sum: new_sum,
+        Movie.rating_count: new_count,
+        Movie.rat: case(
+            (new_count > 0, func.round(new_sum / new_count, 1)),
+            else_=func.coalesce(Movie.imported_rat, 0),
+        ),
+        Movie.updated_at: func.now(),
+    }
+
+
+def apply_review_rating(
+    db: Session, movie_id: int, rating: Optional[float], added: bool = True
+) -> None:
+    """
+    Add (or remove) one review's rating to the movie's running aggregates.
+
+    Runs as a single UPDATE in the caller's transaction, so it must be
+    committed together with the review INSERT/DELETE.
+
+    Args:
+        db: Database session
+        movie_id: Reviewed movie id
+        rating: Review rating (reviews without a rating are ignored)
+        added: True when the review is created, False when it is deleted
+    """
+    if rating is None:
+        return
+
+    value = Decimal(str(rating))
+    step = 1 if added else -1
+    new_sum = Movie.rating_sum + value * step
+    new_count = Movie.rating_count + step
+    db.execute(
+        update(Movie)
+        .where(Movie.mid == movie_id)
+        .values(_rating_values(new_sum, new_count))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def insert_review_with_rating(
+    db: Session, user_id: int, movie_id: int, content: str, rating: Optional[float]
+) -> Optional[Row]:
+    """
+    Insert a review and add its rating to the movie aggregates in one statement.
+
+    Relies on UNIQUE (uid, mid): a duplicate review inserts nothing and leaves
+    the aggregates untouched, so concurrent requests cannot both succeed.
+
+    Returns:
+        The inserted review row (rid, uid, mid, rat, dec, created_at),
+        or None if the user already reviewed the movie
+    """
+    inserted = (
+        insert(Review)
+        .values(uid=user_id, mid=movie_id, dec=content, rat=rating)
+        .on_conflict_do_nothing(index_elements=[Review.uid, Review.mid])
+        .returning(
+            Review.rid,
+            Review.uid,
+            Review.mid,
+            Review.rat,
+            Review.dec,
+            Review.created_at,
+        )
+        .cte("inserted")
+    )
+    aggregates = (
+        update(Movie)
+        .where(Movie.mid == inserted.c.mid, inserted.c.rat.isnot(None))
+        .values(
+            _rating_values(
+                Movie.rating_sum + inserted.c.rat, Movie.rating_count + 1
+            )
+        )
+        .cte("aggregates")
+    )
+    return db.execute(select(inserted).add_cte(aggregates)).first()
+
+
+def remove_user_ratings(db: Session, user_id: int) -> None:
+    """Subtract every rating of a user's reviews, e.g. before deleting the user."""
+    totals = (
+        select(
+            Review.mid.label("mid"),
+            func.sum(Review.rat).label("rating_sum"),
+            func.count(Review.rat).label("rating_count"),
+        )
+        .where(Review.uid == user_id, Review.rat.isnot(None))
+        .group_by(Review.mid)
+        .subquery()
+    )
+    new_sum = Movie.rating_sum - totals.c.rating_sum
+    new_count = Movie.rating_count - totals.c.rating_count
+    db.execute(
+        update(Movie)
+        .where(Movie.mid == totals.c.mid)
+        .values(_rating_values(new_sum, new_count))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def backfill_ratings(db: Session) -> int:
+    """
+    Recompute rating_sum/rating_count/rat from the review table.
+
+    Movies without reviews get zeroed counters and fall back to
+    `imported_rat` (0 if unknown), the same value deleting their last review
+    leaves.
+
+    Returns:
+        Number of movies that have at least one rated review
+    """
+    totals = (
+        select(
+            Review.mid.label("mid"),
+            func.sum(Review.rat).label("rating_sum"),
+            func.count(Review.rat).label("rating_count"),
+        )
+        .where(Review.rat.isnot(None))
+        .group_by(Review.mid)
+        .subquery()
+    )
+    db.execute(
+        update(Movie)
+        .values(
+            {
+                Movie.rating_sum: 0,
+                Movie.rating_count: 0,
+                Movie.rat: func.coalesce(Movie.imported_rat, 0),
+                Movie.updated_at: func.now(),
+            }
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = db.execute(
+        update(Movie)
+        .where(Movie.mid == totals.c.mid)
+        .values(_rating_values(totals.c.rating_sum, totals.c.rating_count))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -0,0 +1,70 @@
+"""
+추천 영화 후보 풀
+
+평점 `RECOMMEND_MIN_RATING` 이상인 영화 id 와 전체 영화 id 를 압축 배열(array)로
+메모리에 들고 있다가, 요청 시에는 메모리에서 무작위로 뽑은 뒤 한 번의 IN 쿼리로
+가져온다. 풀은 백그라운드에서 주기적으로 다시 만든다. (ORDER BY random() 제거)
+"""
+
+import random
+import threading
+from array import array
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Movie
+
+# Extra ids to sample in case some were deleted since the last refresh
+SAMPLE_MARGIN = 4
+
+
+class CandidatePool:
+    def __init__(self):
+        self.rated = array("i")
+        self.all = array("i")
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def refresh(self, db: Session):
+        rated = array("i")
+        all_ids = array("i")
+        rows = db.query(Movie.mid, Movie.rat).order_by(Movie.mid).yield_per(10_000)
+        for mid, rat in rows:
+            all_ids.append(mid)
+            if rat is not None and rat >= settings.RECOMMEND_MIN_RATING:
+                rated.append(mid)
+
+        # Swap references; readers see either the old or the new pool
+        with self._lock:
+            self.rated, self.all = rated, all_ids
+            self.loaded = True
+
+    def sample(self, limit: int) -> List[int]:
+        """Pick up to limit + SAMPLE_MARGIN random ids, preferring rated movies."""
+        pool = self.rated if len(self.rated) >= limit else self.all
+        return random.sample(pool, min(len(pool), limit + SAMPLE_MARGIN))
+
+
+candidate_pool = CandidatePool()
+
+
+def sample_movie_ids(db: Session, limit: int) -> List[int]:
+    """
+    Random movie ids from the candidate pool (a few more than `limit`, so the
+    caller can skip movies deleted since the last refresh).
+    """
+    if not candidate_pool.loaded:
+        candidate_pool.refresh(db)
+    return candidate_pool.sample(limit)
+
+
+def run_refresh():
+    """Background job entry point: rebuild the candidate pool."""
+    db = SessionLocal()
+    try:
+        candidate_pool.refresh(db)
+    finally:
+        db.close()
@@ -0,0 +1,93 @@
+"""
+pg_trgm 기반 영화 검색
+
+`movie.title`, `movie.director`, `genre.name` 에 `gin_trgm_ops` GIN 인덱스가
+있으면 `ILIKE '%keyword%'` 도 인덱스를 탄다 (scripts/migrate_db.py 참고).
+부분 문자열 의미는 그대로 유지하고, 정렬에는 `word_similarity` 를 사용한다.
+
+한글 제목은 DB의 LC_CTYPE 이 UTF-8 계열일 때만 트라이그램이 추출된다.
+(`C` 로케일이면 한글 문자가 무시되어 인덱스가 쓰이지 않는다.)
+3글자 미만 키워드는 트라이그램이 없으므로 인덱스 전체를 훑는다.
+"""
+
+from typing import Dict, Optional
+
+from sqlalchemy import func, literal
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from app.models import Movie, MovieGenre, Genre
+
+SEARCH_TYPES = ("TITLE", "DIRECTOR", "GENRE")
+
+
+def escape_like(keyword: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def keyword_filter(keyword: str, searchType: str) -> Optional[ColumnElement]:
+    """
+    Build the WHERE clause for a keyword search.
+
+    Args:
+        keyword: Raw search keyword
+        searchType: TITLE, DIRECTOR or GENRE
+
+    Returns:
+        Filter expression, or None if there is nothing to filter on
+    """
+    keyword = keyword.strip()
+    if not keyword:
+        return None
+
+    pattern = f"%{escape_like(keyword)}%"
+    if searchType == "TITLE":
+        return Movie.title.ilike(pattern, escape="\\")
+    if searchType == "DIRECTOR":
+        return Movie.director.ilike(pattern, escape="\\")
+    if searchType == "GENRE":
+        # EXISTS instead of JOIN so a movie never appears twice on a page
+        return Movie.genres.any(
+            MovieGenre.genre.has(Genre.name.ilike(pattern, escape="\\"))
+        )
+    return None
+
+
+def relevance(keyword: str, searchType: str) -> Optional[ColumnElement]:
+    """
+    Similarity score (0..1) of the keyword against the searched column.
+
+    `word_similarity` scores the best matching extent inside the column, so a
+    short keyword that appears in a long title still ranks high.
+    Returns None for GENRE searches, where every match is an exact label.
+    """
+    keyword = keyword.strip()
+    if not keyword:
+        return None
+    if searchType == "TITLE":
+        return func.word_similarity(literal(keyword), Movie.title)
+    if searchType == "DIRECTOR":
+        return func.word_similarity(
+            literal(keyword), func.coalesce(Movie.director, "")
+        )
+    return None
+
+
+def genre_facets(db: Session, condition: Optional[ColumnElement]) -> Dict[str, int]:
+    """
+    Count matching movies per genre with one grouped aggregate.
+
+    Args:
+        db: Database session
+        condition: Filter from `keyword_filter` (None = whole catalog)
+
+    Returns:
+        Mapping of genre name -> number of matching movies
+    """
+    query = db.query(Genre.name, func.count(MovieGenre.mid)).join(
+        MovieGenre, MovieGenre.gid == Genre.gid
+    )
+    if condition is not None:
+        query = query.join(Movie, Movie.mid == MovieGenre.mid).filter(condition)
+    return dict(query.group_by(Genre.name).all())
@@ -0,0 +1,366 @@
+"""
+2단 응답 캐시: L1(프로세스 메모리, 핫 키 전용) + L2(Redis, 워커 간 공유)
+
+`REDIS_CACHE_ENABLED=true` 이면 캐시된 JSON 본문을 Redis(L2)에 저장해 모든 uvicorn
+워커가 같은 항목을 쓴다. 꺼져 있거나 Redis 오류가 나면 프로세스 메모리 캐시
+(app/services/cache.py)가 L2 역할을 한다.
+
+- L1: 몇 초짜리 TTL 의 작은 프로세스 캐시. 윈도우(`CACHE_HOT_KEY_WINDOW_SECONDS`) 안에
+  `CACHE_HOT_KEY_THRESHOLD` 번 이상 읽힌 핫 키만 올려서, 인기 영화/프로필 하나가
+  Redis 키 하나를 두드리지 않게 한다.
+- 계층별 hit/miss/지연 시간은 관리자 API(/api/admin/cache-stats)에서 확인
+
+- single-flight: 같은 키의 동시 miss 는 프로세스 안에서는 한 스레드만, 워커 사이에서는
+  `SET lock:<key> NX PX` 락을 잡은 한 워커만 DB 를 조회하고 나머지는 결과를 기다린다.
+- 조기 확률적 갱신(XFetch): 만료가 가까울수록, 계산이 오래 걸린 항목일수록 높은 확률로
+  한 요청이 미리 다시 계산한다. 다른 요청은 그동안 기존 값을 그대로 받는다.
+"""
+
+import math
+import random
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+
+import redis
+from fastapi import Response
+
+from app.config import settings
+from app.redis_client import cache_breaker, get_cache_redis
+from app.services.cache import ResponseCache, response_cache, render_json
+
+LOCK_TTL_MS = 5000
+WAIT_TIMEOUT = 3.0
+POLL_INTERVAL = 0.05
+XFETCH_BETA = 1.0
+
+RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _pack(body: bytes, expires_at: float, delta: float) -> bytes:
+    return f"{expires_at:.3f} {delta:.4f}\n".encode() + body
+
+
+def _unpack(raw: bytes) -> Tuple[float, float, bytes]:
+    header, body = raw.split(b"\n", 1)
+    expires_at, delta = header.split()
+    return float(expires_at), float(delta), body
+
+
+def _should_refresh_early(expires_at: float, delta: float) -> bool:
+    # XFetch: now - delta * beta * ln(rand) >= expiry
+    return time.time() - delta * XFETCH_BETA * math.log(1 - random.random()) >= (
+        expires_at
+    )
+
+
+class TierStats:
+    """Hit/miss counters and lookup latency for one cache tier."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, hit: bool, seconds: float):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self.seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": self.hits / total if total else 0.0,
+                "avgLatencyMs": self.seconds / total * 1000 if total else 0.0,
+                "maxLatencyMs": self.max_seconds * 1000,
+            }
+
+
+class HotKeyDetector:
+    """
+    Count reads per key in fixed time windows.
+
+    A key read `threshold` times within one window is hot. Counters are reset
+    every window (and when more than `max_keys` keys are tracked), so memory
+    stays bounded.
+    """
+
+    def __init__(self, threshold: int, window: float, max_keys: int = 10_000):
+        self.threshold = threshold
+        self.window = window
+        self.max_keys = max_keys
+        self._counts: Dict[str, int] = {}
+        self._window_start = time.monotonic()
+        self._lock = threading.Lock()
+        self.promotions = 0
+
+    def hit(self, key: str) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                now - self._window_start >= self.window
+                or len(self._counts) >= self.max_keys
+            ):
+                self._counts = {}
+                self._window_start = now
+            count = self._counts.get(key, 0) + 1
+            self._counts[key] = count
+            if count == self.threshold:
+                self.promotions += 1
+            return count >= self.threshold
+
+
+class _Flight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[bytes] = None
+
+
+class SharedCache:
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+        self.early_refreshes = 0
+        self.l1 = ResponseCache(
+            max_entries=settings.CACHE_L1_MAX_ENTRIES,
+            max_bytes=settings.CACHE_L1_MAX_BYTES,
+            ttl=settings.CACHE_L1_TTL_SECONDS,
+        )
+        self.hot_keys = HotKeyDetector(
+            settings.CACHE_HOT_KEY_THRESHOLD, settings.CACHE_HOT_KEY_WINDOW_SECONDS
+        )
+        self.l1_stats = TierStats()
+        self.l2_stats = TierStats()
+        self.build_stats = TierStats()
+
+    def _single_flight(self, key: str, fn: Callable[[], bytes]) -> bytes:
+        """Run `fn` once per key inside this process; concurrent callers wait."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.event.wait(WAIT_TIMEOUT)
+            if flight.result is not None:
+                return flight.result
+            return fn()  # leader failed or is too slow
+
+        try:
+            flight.result = fn()
+            return flight.result
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def get_or_build(
+        self, key: str, build: Callable[[], bytes], ttl: Optional[float] = None
+    ) -> bytes:
+        """
+        Cached bytes for `key`, calling `build` at most once per miss.
+
+        Args:
+            key: Cache key
+            build: Produces the serialized value (exceptions are not cached)
+            ttl: Seconds to live (defaults to CACHE_TTL_SECONDS)
+        """
+        ttl = response_cache.ttl if ttl is None else ttl
+        build = self._timed(build)
+        client = get_cache_redis()
+        if client is None:
+            return self._local_get_or_build(key, build, ttl)
+
+        hot = self.hot_keys.hit(key)
+        start = time.perf_counter()
+        body = self.l1.get(key)
+        self.l1_stats.record(body is not None, time.perf_counter() - start)
+        if body is not None:
+            return body
+
+        try:
+            body = self._redis_get_or_build(client, key, build, ttl)
+        except redis.RedisError as e:
+            print(f"Error using Redis cache: {e}")
+            return self._local_get_or_build(key, build, ttl)
+
+        if hot:
+            self.l1.set(key, body, size=len(body), ttl=min(ttl, self.l1.ttl))
+        return body
+
+    def _timed(self, build: Callable[[], bytes]) -> Callable[[], bytes]:
+        def timed_build():
+            start = time.perf_counter()
+            try:
+                return build()
+            finally:
+                self.build_stats.record(False, time.perf_counter() - start)
+
+        return timed_build
+
+    def _local_get_or_build(self, key, build, ttl) -> bytes:
+        start = time.perf_counter()
+        body = response_cache.get(key)
+        self.l2_stats.record(body is not None, time.perf_counter() - start)
+        if body is not None:
+            return body
+
+        def fill():
+            body = build()
+            response_cache.set(key, body, size=len(body), ttl=ttl)
+            return body
+
+        return self._single_flight(key, fill)
+
+    def _redis_get_or_build(self, client, key, build, ttl) -> bytes:
+        start = time.perf_counter()
+        raw = client.get(key)
+        self.l2_stats.record(raw is not None, time.perf_counter() - start)
+        if raw is not None:
+            expires_at, delta, body = _unpack(raw)
+            if not _should_refresh_early(expires_at, delta):
+                return body
+            # One request recomputes ahead of expiry; everyone else keeps the
+            # current value
+            token = self._acquire(client, key)
+            if token is None:
+                return body
+            self.early_refreshes += 1
+            try:
+                return self._store(client, key, build, ttl)
+            finally:
+                self._release(client, key, token)
+
+        return self._single_flight(
+            key, lambda: self._fill_from_redis(client, key, build, ttl)
+        )
+
+    def _fill_from_redis(self, client, key, build, ttl) -> bytes:
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        while True:
+            token = self._acquire(client, key)
+            if token is not None:
+                try:
+                    # Another worker may have filled it while we waited
+                    raw = client.get(key)
+                    if raw is not None:
+                        return _unpack(raw)[2]
+                    return self._store(client, key, build, ttl)
+                finally:
+                    self._release(client, key, token)
+
+            raw = client.get(key)
+            if raw is not None:
+                return _unpack(raw)[2]
+            if time.monotonic() > deadline:
+                return build()
+            time.sleep(POLL_INTERVAL)
+
+    @staticmethod
+    def _store(client, key, build, ttl) -> bytes:
+        start = time.monotonic()
+        body = build()
+        delta = time.monotonic() - start
+        client.set(key, _pack(body, time.time() + ttl, delta), px=int(ttl * 1000))
+        return body
+
+    @staticmethod
+    def _acquire(client, key) -> Optional[str]:
+        token = uuid.uuid4().hex
+        if client.set(f"lock:{key}", token, nx=True, px=LOCK_TTL_MS):
+            return token
+        return None
+
+    @staticmethod
+    def _release(client, key, token):
+        client.eval(RELEASE_LOCK, 1, f"lock:{key}", token)
+
+    def stats(self) -> dict:
+        redis_enabled = get_cache_redis() is not None
+        return {
+            "l1": {**self.l1.stats(), **self.l1_stats.as_dict()},
+            "l2": {
+                "backend": "redis" if redis_enabled else "local",
+                **self.l2_stats.as_dict(),
+                "breaker": cache_breaker.stats(),
+            },
+            "local": response_cache.stats(),
+            "builds": {
+                "count": self.build_stats.misses,
+                "avgLatencyMs": self.build_stats.as_dict()["avgLatencyMs"],
+                "maxLatencyMs": self.build_stats.as_dict()["maxLatencyMs"],
+            },
+            "hotKeyPromotions": self.hot_keys.promotions,
+            "coalesced": self.coalesced,
+            "earlyRefreshes": self.early_refreshes,
+        }
+
+    def evict_local(self, *keys: str):
+        """Drop keys from this process only (L1 and the local fallback)."""
+        self.l1.invalidate(*keys)
+        response_cache.invalidate(*keys)
+
+    def evict_local_prefix(self, prefix: str):
+        self.l1.invalidate_prefix(prefix)
+        response_cache.invalidate_prefix(prefix)
+
+    def clear_local(self):
+        self.l1.clear()
+        response_cache.clear()
+
+    def invalidate(self, *keys: str):
+        self.evict_local(*keys)
+        client = get_cache_redis()
+        if client is None or not keys:
+            return
+        try:
+            client.delete(*keys)
+        except redis.RedisError as e:
+            print(f"Error invalidating Redis cache: {e}")
+
+    def invalidate_prefix(self, prefix: str):
+        self.evict_local_prefix(prefix)
+        client = get_cache_redis()
+        if client is None:
+            return
+        try:
+            keys = list(client.scan_iter(match=f"{prefix}*", count=500))
+            if keys:
+                client.delete(*keys)
+        except redis.RedisError as e:
+            print(f"Error invalidating Redis cache: {e}")
+
+
+shared_cache = SharedCache()
+
+
+def cached_response(
+    key: str, build: Callable[[], object], ttl: Optional[float] = None
+) -> Response:
+    """
+    Serve a JSON payload from the shared cache, building it on a miss.
+
+    The serialized body is cached, so a hit skips both the database and
+    serialization. Exceptions from `build` (e.g. 404) are not cached.
+    """
+    body = shared_cache.get_or_build(key, lambda: render_json(build()), ttl)
+    return Response(content=body, media_type="application/json")
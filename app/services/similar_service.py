@@ -0,0 +1,344 @@
+"""
+콘텐츠 기반 "비슷한 영화" (TF-IDF)
+
+영화 설명(`Movie.dec`), 감독, 장르로 TF-IDF 벡터를 만들고 코사인 유사도가 높은
+상위 `SIMILAR_NEIGHBORS` 개를 미리 계산해 `SIMILAR_INDEX_DIR` 에 .npy 로 저장한다.
+조회 시에는 np.load(mmap_mode="r") 로 연 배열에서 한 행만 읽는다.
+
+빌드 결과는 버전마다 새 디렉터리(`v<ns>/`)에 쓰고, 다 쓴 뒤 `CURRENT` 포인터 파일을
+rename 으로 바꿔 공개한다. 읽는 쪽은 항상 한 버전의 파일만 열기 때문에 옛 배열과 새
+배열이 섞이지 않는다. 전체 재빌드는 advisory lock 으로 워커 하나만 수행한다.
+
+한국어 설명은 조사가 붙어 있어 단어 단위 매칭이 잘 안 되므로 음절 bigram 으로
+토큰화한다. 외부 모델/서비스는 사용하지 않는다.
+
+관리자가 영화를 추가/수정하면 `update_movie` 가 기존 어휘(vocab)/IDF 로 해당 영화
+벡터만 다시 계산해 오버레이에 반영하고, 변경이 쌓이면 전체 인덱스를 다시 만든다.
+"""
+
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Movie, MovieGenre, Genre
+
+DIRECTOR_WEIGHT = 3
+GENRE_WEIGHT = 2
+BLOCK_SIZE = 1024
+
+# Only one worker rebuilds the index at a time
+REBUILD_LOCK_ID = 5_301_002
+CURRENT_FILE = "CURRENT"
+# Published versions kept on disk (older ones may still be mapped elsewhere)
+KEEP_VERSIONS = 2
+
+TOKEN_RE = re.compile(r"\w+")
+HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = []
+    for word in TOKEN_RE.findall(text.lower()):
+        if HANGUL_RE.search(word):
+            if len(word) == 1:
+                tokens.append(word)
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        elif len(word) > 1:
+            tokens.append(word)
+    return tokens
+
+
+def movie_terms(
+    description: Optional[str], director: Optional[str], genres: List[str]
+) -> Counter:
+    terms = Counter(tokenize(description or ""))
+    if director:
+        terms[f"director:{director.strip().lower()}"] += DIRECTOR_WEIGHT
+    for genre in genres:
+        terms[f"genre:{genre}"] += GENRE_WEIGHT
+    return terms
+
+
+def _load_documents(db: Session) -> Tuple[List[int], List[Counter]]:
+    genres: Dict[int, List[str]] = {}
+    rows = db.query(MovieGenre.mid, Genre.name).join(Genre, MovieGenre.gid == Genre.gid)
+    for mid, name in rows:
+        genres.setdefault(mid, []).append(name)
+
+    ids, docs = [], []
+    for mid, dec, director in (
+        db.query(Movie.mid, Movie.dec, Movie.director).order_by(Movie.mid)
+    ):
+        ids.append(mid)
+        docs.append(movie_terms(dec, director, genres.get(mid, [])))
+    return ids, docs
+
+
+def _vectorize(terms: Counter, vocab: Dict[str, int], idf: np.ndarray):
+    """Sublinear TF * IDF, L2-normalized. Unknown terms are ignored."""
+    cols, values = [], []
+    for term, count in terms.items():
+        col = vocab.get(term)
+        if col is not None:
+            cols.append(col)
+            values.append((1 + math.log(count)) * idf[col])
+    vector = sparse.csr_matrix(
+        (values, ([0] * len(cols), cols)), shape=(1, len(vocab)), dtype=np.float32
+    )
+    norm = np.sqrt(vector.multiply(vector).sum())
+    return vector / norm if norm > 0 else vector
+
+
+def _top_k(cols: np.ndarray, sims: np.ndarray, k: int):
+    if len(cols) > k:
+        top = np.argpartition(sims, -k)[-k:]
+        cols, sims = cols[top], sims[top]
+    order = np.argsort(-sims, kind="stable")
+    return cols[order], sims[order]
+
+
+class SimilarIndex:
+    def __init__(self, path: str, k: int):
+        self.path = path
+        self.k = k
+        self.version: Optional[str] = None
+        self.ids: Optional[np.ndarray] = None
+        self.neighbors: Optional[np.ndarray] = None
+        self.scores: Optional[np.ndarray] = None
+        self.rows: Dict[int, int] = {}
+        # Incremental updates since the last full build
+        self.overlay: Dict[int, List[Tuple[int, float]]] = {}
+        self.reverse: Dict[int, Dict[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def _file(self, name: str, version: Optional[str] = None) -> str:
+        return os.path.join(self.path, version or self.version, name)
+
+    def published_version(self) -> Optional[str]:
+        """Version named by the CURRENT pointer, None if nothing was built yet."""
+        try:
+            with open(os.path.join(self.path, CURRENT_FILE), encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def load(self) -> bool:
+        """Open the published arrays memory-mapped; False if no index on disk."""
+        version = self.published_version()
+        if version is None:
+            return False
+        try:
+            ids = np.load(self._file("ids.npy", version), mmap_mode="r")
+            neighbors = np.load(self._file("neighbors.npy", version), mmap_mode="r")
+            scores = np.load(self._file("scores.npy", version), mmap_mode="r")
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            self.version = version
+            self.ids, self.neighbors, self.scores = ids, neighbors, scores
+            self.rows = {int(mid): row for row, mid in enumerate(ids)}
+            self.overlay, self.reverse = {}, {}
+        return True
+
+    def build(self, db: Session) -> bool:
+        """
+        Rebuild the whole index from the database and publish it on disk.
+
+        Holds a transaction-level advisory lock on `db` until the caller ends
+        the transaction.
+
+        Returns:
+            False if another worker is already rebuilding
+        """
+        locked = db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": REBUILD_LOCK_ID}
+        ).scalar()
+        if not locked:
+            return False
+
+        ids, docs = _load_documents(db)
+
+        vocab: Dict[str, int] = {}
+        df: Counter = Counter()
+        for terms in docs:
+            df.update(terms.keys())
+        for term in df:
+            vocab[term] = len(vocab)
+        n = len(docs)
+        idf = np.zeros(len(vocab), dtype=np.float32)
+        for term, col in vocab.items():
+            idf[col] = math.log((1 + n) / (1 + df[term])) + 1
+
+        if docs:
+            matrix = sparse.vstack([_vectorize(t, vocab, idf) for t in docs]).tocsr()
+        else:
+            matrix = sparse.csr_matrix((0, len(vocab)), dtype=np.float32)
+
+        id_array = np.asarray(ids, dtype=np.int32)
+        neighbors = np.full((n, self.k), -1, dtype=np.int32)
+        scores = np.zeros((n, self.k), dtype=np.float32)
+        matrix_t = matrix.T.tocsc()
+        for block_start in range(0, n, BLOCK_SIZE):
+            block = (matrix[block_start : block_start + BLOCK_SIZE] @ matrix_t).tocsr()
+            for offset in range(block.shape[0]):
+                row = block_start + offset
+                start, end = block.indptr[offset], block.indptr[offset + 1]
+                cols = block.indices[start:end]
+                sims = block.data[start:end]
+                keep = (cols != row) & (sims > 0)
+                cols, sims = _top_k(cols[keep], sims[keep], self.k)
+                neighbors[row, : len(cols)] = id_array[cols]
+                scores[row, : len(cols)] = sims
+
+        arrays = {
+            "ids.npy": id_array,
+            "neighbors.npy": neighbors,
+            "scores.npy": scores,
+            "idf.npy": idf,
+        }
+        self._publish(arrays, matrix, vocab)
+        self.load()
+        return True
+
+    def _publish(self, arrays: Dict[str, np.ndarray], matrix, vocab: Dict[str, int]):
+        os.makedirs(self.path, exist_ok=True)
+        # Write the whole version under a private name first
+        building = tempfile.mkdtemp(prefix=".build-", dir=self.path)
+        try:
+            for name, array in arrays.items():
+                np.save(os.path.join(building, name), array)
+            sparse.save_npz(os.path.join(building, "tfidf.npz"), matrix)
+            with open(os.path.join(building, "vocab.json"), "w", encoding="utf-8") as f:
+                json.dump(vocab, f, ensure_ascii=False)
+            version = f"v{time.time_ns()}"
+            os.rename(building, os.path.join(self.path, version))
+        except BaseException:
+            shutil.rmtree(building, ignore_errors=True)
+            raise
+
+        # Swapping the pointer is the single atomic step readers observe
+        pointer = os.path.join(self.path, f".{CURRENT_FILE}.{os.getpid()}")
+        with open(pointer, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(pointer, os.path.join(self.path, CURRENT_FILE))
+        self._prune()
+
+    def _prune(self):
+        # Called under the rebuild lock, so leftover .build-* dirs are stale
+        entries = os.listdir(self.path)
+        versions = sorted(e for e in entries if e.startswith("v"))
+        stale = [e for e in entries if e.startswith(".build-")]
+        for name in stale + versions[:-KEEP_VERSIONS]:
+            shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
+
+    def update_movie(self, db: Session, movie_id: int):
+        """
+        Recompute one movie's neighbors against the saved TF-IDF matrix.
+
+        Uses the existing vocabulary/IDF; new terms count once the index is
+        fully rebuilt.
+        """
+        if self.ids is None:
+            return
+        if self.version != self.published_version():
+            # Another worker published a newer build; older files may be pruned
+            self.load()
+        movie = db.query(Movie).filter(Movie.mid == movie_id).first()
+        if movie is None:
+            return
+        genres = [
+            name
+            for (name,) in db.query(Genre.name)
+            .join(MovieGenre, MovieGenre.gid == Genre.gid)
+            .filter(MovieGenre.mid == movie_id)
+        ]
+
+        with open(self._file("vocab.json"), encoding="utf-8") as f:
+            vocab = json.load(f)
+        idf = np.load(self._file("idf.npy"))
+        matrix = sparse.load_npz(self._file("tfidf.npz"))
+
+        vector = _vectorize(movie_terms(movie.dec, movie.director, genres), vocab, idf)
+        sims = np.asarray((matrix @ vector.T).todense()).ravel()
+        cols = np.flatnonzero(sims > 0)
+        ids = np.asarray(self.ids)
+        cols = cols[ids[cols] != movie_id]
+        cols, values = _top_k(cols, sims[cols], self.k)
+
+        with self._lock:
+            for mid, _ in self.overlay.get(movie_id, []):
+                self.reverse.get(mid, {}).pop(movie_id, None)
+            self.overlay[movie_id] = [
+                (int(ids[c]), float(v)) for c, v in zip(cols, values)
+            ]
+            for c, v in zip(cols, values):
+                self.reverse.setdefault(int(ids[c]), {})[movie_id] = float(v)
+
+    def similar(self, movie_id: int, limit: int) -> List[int]:
+        """Most similar movie ids, best first ([] if the movie is unknown)."""
+        overlay = self.overlay.get(movie_id)
+        if overlay is not None:
+            return [mid for mid, _ in overlay[:limit]]
+
+        row = self.rows.get(movie_id)
+        if row is None:
+            return []
+        candidates = [
+            (int(mid), float(score))
+            for mid, score in zip(self.neighbors[row], self.scores[row])
+            if mid >= 0 and int(mid) not in self.overlay
+        ]
+        candidates.extend(self.reverse.get(movie_id, {}).items())
+        candidates.sort(key=lambda item: -item[1])
+        return [mid for mid, _ in candidates[:limit]]
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.overlay)
+
+
+similar_index = SimilarIndex(settings.SIMILAR_INDEX_DIR, settings.SIMILAR_NEIGHBORS)
+
+
+def update_movie(movie_id: int):
+    """Admin write hook (run as a background task after the response)."""
+    db = SessionLocal()
+    try:
+        similar_index.update_movie(db, movie_id)
+    finally:
+        db.close()
+
+
+def run_rebuild():
+    """
+    Background job entry point.
+
+    Opens the index saved on disk; rebuilds it when there is none yet or when
+    admin edits have been applied incrementally since the last build. Skips
+    the rebuild while another worker holds the lock.
+    """
+    if similar_index.ids is None and similar_index.load():
+        return
+    if similar_index.ids is not None and not similar_index.dirty:
+        if similar_index.version != similar_index.published_version():
+            similar_index.load()
+        return
+    db = SessionLocal()
+    try:
+        similar_index.build(db)
+    finally:
+        db.close()
@@ -0,0 +1,102 @@
+"""
+검증된 JWT payload 캐시 (LRU)
+
+get_current_user 는 요청마다 python-jose 로 HMAC 서명 검증 + claim 파싱을 다시 한다.
+같은 토큰은 몇 분~며칠 동안 반복해서 들어오므로, 한 번 검증한 payload 를 토큰의
+SHA-256 다이제스트 키로 기억해 둔다.
+
+- 항목은 토큰의 exp 까지만 유효 (만료되면 다시 jose 로 검증 → ExpiredSignatureError)
+- 블랙리스트에 오른 토큰(로그아웃)은 `evict` 로 즉시 제거
+- 키는 다이제스트라 토큰 원문은 메모리에 남지 않는다.
+- 개수 한도: JWT_CACHE_MAX_ENTRIES, 끄기: JWT_CACHE_ENABLED=false
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from jose import jwt
+
+from app.config import settings
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _verify(token: str) -> dict:
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
+class VerifiedTokenCache:
+    def __init__(self, max_entries: int, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        # digest -> (exp, payload), least recently used first
+        self._data: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def decode(self, token: str) -> dict:
+        """
+        Verify a JWT and return its claims, like `jwt.decode`.
+
+        Returns a copy, so callers may modify it.
+
+        Raises:
+            JWTError: If the token is invalid or expired
+        """
+        if not self.enabled:
+            return _verify(token)
+
+        key = _digest(token)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return dict(entry[1])
+                del self._data[key]
+            self.misses += 1
+
+        payload = _verify(token)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            with self._lock:
+                self._data[key] = (exp, payload)
+                self._data.move_to_end(key)
+                while len(self._data) > self.max_entries:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+        return dict(payload)
+
+    def evict(self, token: str):
+        with self._lock:
+            self._data.pop(_digest(token), None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._data),
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": self.hits / total if total else 0.0,
+            }
+
+
+verified_tokens = VerifiedTokenCache(
+    max_entries=settings.JWT_CACHE_MAX_ENTRIES, enabled=settings.JWT_CACHE_ENABLED
+)
@@ -1,286 +1,305 @@
-# from datetime import datetime, timedelta, timezone
-# from typing import Optional
-# from jose import JWTError
-# from app.redis_client import get_redis_client
-# from app.utils import decode_token
-
-
-# class TokenBlacklistService:
-#     """
-#     Service for managing token blacklist using Redis.
-
-#     Blacklisted tokens are stored with their remaining TTL (time-to-live)
-#     to automatically expire when the original token would have expired.
-#     """
-
-#     BLACKLIST_PREFIX = "blacklist:"
-
-#     @staticmethod
-#     async def add_to_blacklist(token: str) -> bool:
-#         """
-#         Add a token to the blacklist.
-
-#         Args:
-#             token: JWT token to blacklist
-
-#         Returns:
-#             True if successfully added, False otherwise
-#         """
-#         redis_client = None
-#         try:
-#             redis_client = get_redis_client()
-
-#             # Decode token to get expiration time
-#             payload = decode_token(token)
-#             exp_timestamp = payload.get("exp")
-
-#             if not exp_timestamp:
-#                 return False
-
-#             # Calculate remaining TTL
-#             exp_datetime = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
-#             now = datetime.now(timezone.utc)
-#             ttl_seconds = int((exp_datetime - now).total_seconds())
-
-#             # Only blacklist if token hasn't expired yet
-#             if ttl_seconds > 0:
-#                 key = f"{TokenBlacklistService.BLACKLIST_PREFIX}{token}"
-#                 await redis_client.setex(key, ttl_seconds, "blacklisted")
-#                 return True
-
-#             return False
-
-#         except (JWTError, Exception) as e:
-#             print(f"Error adding token to blacklist: {e}")
-#             return False
-#         finally:
-#             if redis_client:
-#                 await redis_client.aclose()
-
-#     @staticmethod
-#     async def is_blacklisted(token: str) -> bool:
-#         """
-#         Check if a token is blacklisted.
-
-#         Args:
-#             token: JWT token to check
-
-#         Returns:
-#             True if token is blacklisted, False otherwise
-#         """
-#         redis_client = None
-#         try:
-#             redis_client = get_redis_client()
-#             key = f"{TokenBlacklistService.BLACKLIST_PREFIX}{token}"
-#             result = await redis_client.exists(key)
-#             return bool(result > 0)
-#         except Exception as e:
-#             print(f"Error checking blacklist: {e}")
-#             # Fail open - if Redis is down, allow the request
-#             # (token validation will still happen via JWT signature)
-#             return False
-#         finally:
-#             if redis_client:
-#                 await redis_client.aclose()
-
-#     @staticmethod
-#     async def remove_from_blacklist(token: str) -> bool:
-#         """
-#         Remove a token from the blacklist (rarely used).
-
-#         Args:
-#             token: JWT token to remove
-
-#         Returns:
-#             True if successfully removed, False otherwise
-#         """
-#         redis_client = None
-#         try:
-#             redis_client = get_redis_client()
-#             key = f"{TokenBlacklistService.BLACKLIST_PREFIX}{token}"
-#             result = await redis_client.delete(key)
-#             return bool(result > 0)
-#         except Exception as e:
-#             print(f"Error removing token from blacklist: {e}")
-#             return False
-#         finally:
-#             if redis_client:
-#                 await redis_client.aclose()
-
-
-# class RefreshTokenService:
-#     """
-#     Service for managing refresh tokens using Redis.
-
-#     Refresh tokens are stored with user email as key to allow
-#     single-device or multi-device session management.
-#     """
-
-#     REFRESH_TOKEN_PREFIX = "refresh_token:"
-
-#     @staticmethod
-#     async def store_refresh_token(
-#         email: str, refresh_token: str, expires_delta: Optional[timedelta] = None
-#     ) -> bool:
-#         """
-#         Store a refresh token for a user.
-
-#         Args:
-#             email: User's email
-#             refresh_token: The refresh token to store
-#             expires_delta: Optional custom expiration time
-
-#         Returns:
-#             True if successfully stored, False otherwise
-#         """
-#         redis_client = None
-#         try:
-#             redis_client = get_redis_client()
-
-#             if expires_delta:
-#                 ttl_seconds = int(expires_delta.total_seconds())
-#             else:
-#                 from app.config import settings
-
-#                 ttl_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
-
-#             key = f"{RefreshTokenService.REFRESH_TOKEN_PREFIX}{email}"
-#             await redis_client.setex(key, ttl_seconds, refresh_token)
-#             return True
-
-#         except Exception as e:
-#             print(f"Error storing refresh token: {e}")
-#             return False
-#         finally:
-#             if redis_client:
-#                 await redis_client.aclose()
-
-#     @staticmethod
-#     async def get_refresh_token(email: str) -> Optional[str]:
-#         """
-#         Get the stored refresh token for a user.
-
-#         Args:
-#             email: User's email
-
-#         Returns:
-#             Refresh token if exists, None otherwise
-#         """
-#         redis_client = None
-#         try:
-#             redis_client = get_redis_client()
-#             key = f"{RefreshTokenService.REFRESH_TOKEN_PREFIX}{email}"
-#             result = await redis_client.get(key)
-#             return str(result) if result else None
-#         except Exception as e:
-#             print(f"Error getting refresh token: {e}")
-#             return None
-#         finally:
-#             if redis_client:
-#                 await redis_client.aclose()
-
-#     @staticmethod
-#     async def verify_refresh_token(email: str, refresh_token: str) -> bool:
-#         """
-#         Verify if the provided refresh token matches the stored one.
-
-#         Args:
-#             email: User's email
-#             refresh_token: Refresh token to verify
-
-#         Returns:
-#             True if tokens match, False otherwise
-#         """
-#         try:
-#             stored_token = await RefreshTokenService.get_refresh_token(email)
-#             return stored_token == refresh_token if stored_token else False
-#         except Exception as e:
-#             print(f"Error verifying refresh token: {e}")
-#             return False
-
-#     @staticmethod
-#     async def delete_refresh_token(email: str) -> bool:
-#         """
-#         Delete a user's refresh token (e.g., on logout).
-
-#         Args:
-#             email: User's email
-
-#         Returns:
-#             True if successfully deleted, False otherwise
-#         """
-#         redis_client = None
-#         try:
-#             redis_client = get_redis_client()
-#             key = f"{RefreshTokenService.REFRESH_TOKEN_PREFIX}{email}"
-#             result = await redis_client.delete(key)
-#             return bool(result > 0)
-#         except Exception as e:
-#             print(f"Error deleting refresh token: {e}")
-#             return False
-#         finally:
-#             if redis_client:
-#                 await redis_client.aclose()
-
-from typing import Optional
-from datetime import timedelta
-
 """
-Redis 비활성화 버전 Token / Refresh Token 서비스
-
-- 학교 / 개발 환경용
-- Redis 연결 시도 ❌
-- 모든 토큰은 JWT 자체 검증만 사용
+Token 블랙리스트 / Refresh Token 서비스
+
+저장소는 TOKEN_BACKEND 설정으로 고른다.
+
+- disabled (기본, 학교 / 개발 환경용): 아무것도 저장하지 않는다. 블랙리스트는 항상
+  비어 있고 refresh token 은 JWT 자체 검증만 사용
+- memory: 프로세스 메모리 (워커 1개일 때만 의미 있음)
+- redis: lifespan 에서 만든 공유 연결 풀(app/redis_client.py) 사용. 쓰기는 로컬
+  메모리에도 복사해 두고, Redis 가 죽어 서킷이 열리면 바로 로컬 값으로 응답한다.
+  장애 중 실패한 쓰기/삭제는 저널에 남겨 두었다가 Redis 가 돌아온 뒤 그 워커의 다음
+  호출에서 먼저 Redis 로 재전송한다. 블랙리스트 조회는 로컬과 Redis 중 한 곳에만
+  있어도 거부한다.
 """
 
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from jose import JWTError
+
+from app.config import settings
+from app.redis_client import RedisUnavailable, redis_pool
+from app.services.token_cache import verified_tokens
+
+T = TypeVar("T")
+
+DISABLED = "disabled"
+MEMORY = "memory"
+REDIS = "redis"
+
+
+class MemoryTokenStore:
+    """Key/value store with per-key TTL in process memory."""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def _sweep(self, now: float):
+        # Drop expired keys at most once a minute
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + 60
+        for key in [k for k, (exp, _) in self._data.items() if exp <= now]:
+            del self._data[key]
+
+    async def set(self, key: str, value: str, ttl_seconds: int):
+        now = time.monotonic()
+        with self._lock:
+            self._sweep(now)
+            self._data[key] = (now + ttl_seconds, value)
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    async def exists(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+    async def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+
+class RedisTokenStore:
+    """
+    Redis store with a write-through local copy used while Redis is down.
+
+    Writes and deletes that cannot reach Redis are journaled and replayed,
+    oldest first, before the next command once Redis answers again. Until
+    then this worker answers from the local copy.
+    """
+
+    def __init__(self):
+        self.fallback = MemoryTokenStore()
+        # key -> (value, or None for a delete; monotonic expiry)
+        self.pending: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+
+    def _journal(self, key: str, value: Optional[str], expires_at: float):
+        # A newer write supersedes the pending one and moves to the end
+        self.pending.pop(key, None)
+        self.pending[key] = (value, expires_at)
+
+    async def _replay(self):
+        while self.pending:
+            key, entry = next(iter(self.pending.items()))
+            value, expires_at = entry
+            if value is None:
+                await redis_pool.call(lambda client: client.delete(key))
+            elif expires_at > time.monotonic():
+                ttl_seconds = max(1, int(expires_at - time.monotonic()))
+                await redis_pool.call(
+                    lambda client: client.setex(key, ttl_seconds, value)
+                )
+            if self.pending.get(key) == entry:
+                del self.pending[key]
+
+    async def _call(self, command: Callable[..., Awaitable[T]]) -> T:
+        """
+        Replay journaled writes, then run `command(client)`.
+
+        Raises:
+            RedisUnavailable: If Redis cannot be reached
+        """
+        if self.pending:
+            await self._replay()
+        return await redis_pool.call(command)
+
+    async def set(self, key: str, value: str, ttl_seconds: int):
+        await self.fallback.set(key, value, ttl_seconds)
+        self.pending.pop(key, None)
+        try:
+            await self._call(lambda client: client.setex(key, ttl_seconds, value))
+        except RedisUnavailable:
+            self._journal(key, value, time.monotonic() + ttl_seconds)
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self._call(lambda client: client.get(key))
+        except RedisUnavailable:
+            return await self.fallback.get(key)
+
+    async def exists(self, key: str) -> bool:
+        # Deny-list lookups: either copy is enough to reject the token
+        local = await self.fallback.exists(key)
+        try:
+            return bool(await self._call(lambda client: client.exists(key))) or local
+        except RedisUnavailable:
+            return local
+
+    async def delete(self, key: str) -> bool:
+        deleted = await self.fallback.delete(key)
+        self.pending.pop(key, None)
+        try:
+            return bool(await self._call(lambda client: client.delete(key))) or deleted
+        except RedisUnavailable:
+            self._journal(key, None, math.inf)
+            return deleted
+
+
+def _create_store():
+    if settings.TOKEN_BACKEND == MEMORY:
+        return MemoryTokenStore()
+    if settings.TOKEN_BACKEND == REDIS:
+        return RedisTokenStore()
+    if settings.TOKEN_BACKEND != DISABLED:
+        raise ValueError(f"Unknown TOKEN_BACKEND: {settings.TOKEN_BACKEND}")
+    return None
+
+
+token_store = _create_store()
+
 
 class TokenBlacklistService:
     """
-    🔕 Redis 미사용
-    토큰 블랙리스트 기능 완전 비활성화
+    Blacklisted (logged out) access tokens.
+
+    Stored with their remaining TTL so they expire when the token would
+    have. Keys use a digest of the token instead of the token itself.
     """
 
+    BLACKLIST_PREFIX = "blacklist:"
+
+    @staticmethod
+    def _key(token: str) -> str:
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        return f"{TokenBlacklistService.BLACKLIST_PREFIX}{digest}"
+
     @staticmethod
     async def add_to_blacklist(token: str) -> bool:
-        # Redis 안 쓰므로 아무것도 안 함
-        return True
+        """
+        Add a token to the blacklist.
+
+        Args:
+            token: JWT token to blacklist
+
+        Returns:
+            True if successfully added, False otherwise
+        """
+        if token_store is None:
+            return True
+        try:
+            exp_timestamp = verified_tokens.decode(token).get("exp")
+            if not exp_timestamp:
+                return False
+
+            # Calculate remaining TTL
+            exp_datetime = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
+            now = datetime.now(timezone.utc)
+            ttl_seconds = int((exp_datetime - now).total_seconds())
+
+            # Only blacklist if token hasn't expired yet
+            if ttl_seconds > 0:
+                await token_store.set(
+                    TokenBlacklistService._key(token), "blacklisted", ttl_seconds
+                )
+                return True
+            return False
+        except JWTError as e:
+            print(f"Error adding token to blacklist: {e}")
+            return False
 
     @staticmethod
     async def is_blacklisted(token: str) -> bool:
-        # 항상 블랙리스트 아님
-        return False
+        """
+        Check if a token is blacklisted.
+
+        Args:
+            token: JWT token to check
+
+        Returns:
+            True if token is blacklisted, False otherwise
+        """
+        if token_store is None:
+            return False
+        return await token_store.exists(TokenBlacklistService._key(token))
 
     @staticmethod
     async def remove_from_blacklist(token: str) -> bool:
-        return True
+        """
+        Remove a token from the blacklist (rarely used).
+
+        Returns:
+            True if successfully removed, False otherwise
+        """
+        if token_store is None:
+            return True
+        return await token_store.delete(TokenBlacklistService._key(token))
 
 
 class RefreshTokenService:
     """
-    🔕 Redis 미사용
-    Refresh Token 서버 저장 기능 비활성화
+    The current refresh token of each user.
 
-    ✔ 쿠키 기반 인증만 사용
+    Stored with the user email as key, so a new login or refresh replaces
+    the previous token (single active session per user).
     """
 
+    REFRESH_TOKEN_PREFIX = "refresh_token:"
+
     @staticmethod
     async def store_refresh_token(
         email: str,
         refresh_token: str,
         expires_delta: Optional[timedelta] = None,
     ) -> bool:
-        # 서버에 저장하지 않음
+        """
+        Store a refresh token for a user.
+
+        Args:
+            email: User's email
+            refresh_token: The refresh token to store
+            expires_delta: Optional custom expiration time
+
+        Returns:
+            True if successfully stored, False otherwise
+        """
+        if token_store is None:
+            return True
+        if expires_delta:
+            ttl_seconds = int(expires_delta.total_seconds())
+        else:
+            ttl_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+        key = f"{RefreshTokenService.REFRESH_TOKEN_PREFIX}{email}"
+        await token_store.set(key, refresh_token, ttl_seconds)
         return True
 
     @staticmethod
     async def get_refresh_token(email: str) -> Optional[str]:
-        return None
+        if token_store is None:
+            return None
+        key = f"{RefreshTokenService.REFRESH_TOKEN_PREFIX}{email}"
+        return await token_store.get(key)
 
     @staticmethod
     async def verify_refresh_token(email: str, refresh_token: str) -> bool:
-        # 서버 검증 안 함 (JWT 자체 검증만 사용)
-        return True
+        """
+        Verify if the provided refresh token matches the stored one.
+
+        Always True when the backend is disabled (JWT validation only).
+        """
+        if token_store is None:
+            return True
+        stored_token = await RefreshTokenService.get_refresh_token(email)
+        return stored_token == refresh_token if stored_token else False
 
     @staticmethod
     async def delete_refresh_token(email: str) -> bool:
-        return True
+        """Delete a user's refresh token (e.g., on logout)."""
+        if token_store is None:
+            return True
+        key = f"{RefreshTokenService.REFRESH_TOKEN_PREFIX}{email}"
+        return await token_store.delete(key)
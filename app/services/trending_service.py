@@ -0,0 +1,123 @@
+"""
+시간 감쇠(time-decay) 기반 트렌드 랭킹
+
+최근 `TRENDING_WINDOW_DAYS` 동안의 리뷰, 리뷰 좋아요, 댓글을 이벤트로 보고
+각 이벤트에 weight * 0.5 ^ (경과 시간 / 반감기) 점수를 준다.
+주기적으로 movie_trend 테이블에 상위 `TRENDING_SIZE` 개를 순위와 함께 저장하므로
+/api/movies/trend 는 rank PK 순으로 10개만 읽는다.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Movie, MovieTrend
+from app.services import catalog_events
+
+REVIEW_WEIGHT = 3.0
+COMMENT_WEIGHT = 2.0
+LIKE_WEIGHT = 1.0
+
+# Only one worker rebuilds the ranking at a time
+REFRESH_LOCK_ID = 5_301_001
+
+DECAYED_SCORES = text(
+    """
+    WITH events AS (
+        SELECT r.mid, r.created_at, CAST(:w_review AS double precision) AS weight
+        FROM review r
+        WHERE r.created_at >= :since
+        UNION ALL
+        SELECT r.mid, l.created_at, CAST(:w_like AS double precision)
+        FROM review_like l JOIN review r ON r.rid = l.rid
+        WHERE l.created_at >= :since AND l.type = 'L'
+        UNION ALL
+        SELECT r.mid, c.created_at, CAST(:w_comment AS double precision)
+        FROM comment c JOIN review r ON r.rid = c.rid
+        WHERE c.created_at >= :since
+    )
+    SELECT
+        mid,
+        SUM(
+            weight * EXP(
+                -LN(2) * EXTRACT(EPOCH FROM (:now - created_at)) / 3600.0
+                / :half_life
+            )
+        ) AS score
+    FROM events
+    GROUP BY mid
+    ORDER BY score DESC, mid
+    LIMIT :size
+    """
+)
+
+
+def refresh_trending(db: Session) -> int:
+    """
+    Recompute decayed scores and replace the movie_trend ranking.
+
+    Movies without recent activity pad the list by rating so the trend
+    endpoint always has `TRENDING_SIZE` rows to serve.
+
+    Returns:
+        Number of ranked rows written (0 if another worker holds the lock)
+    """
+    locked = db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": REFRESH_LOCK_ID}
+    ).scalar()
+    if not locked:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    size = settings.TRENDING_SIZE
+    scored = db.execute(
+        DECAYED_SCORES,
+        {
+            "now": now,
+            "since": now - timedelta(days=settings.TRENDING_WINDOW_DAYS),
+            "half_life": settings.TRENDING_HALF_LIFE_HOURS,
+            "w_review": REVIEW_WEIGHT,
+            "w_like": LIKE_WEIGHT,
+            "w_comment": COMMENT_WEIGHT,
+            "size": size,
+        },
+    ).all()
+
+    ranking = [(mid, float(score)) for mid, score in scored]
+    if len(ranking) < size:
+        seen = [mid for mid, _ in ranking]
+        padding = (
+            db.query(Movie.mid)
+            .filter(Movie.mid.notin_(seen))
+            .order_by(Movie.rat.desc().nullslast(), Movie.mid)
+            .limit(size - len(ranking))
+            .all()
+        )
+        ranking.extend((mid, 0.0) for (mid,) in padding)
+
+    db.query(MovieTrend).delete(synchronize_session=False)
+    db.bulk_insert_mappings(
+        MovieTrend,
+        [
+            {"rank": rank, "mid": mid, "score": score, "updated_at": now}
+            for rank, (mid, score) in enumerate(ranking, start=1)
+        ],
+    )
+    return len(ranking)
+
+
+def run_refresh():
+    """Background job entry point: refresh the ranking in its own session."""
+    db = SessionLocal()
+    try:
+        refresh_trending(db)
+        db.commit()
+        catalog_events.invalidate_trend()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
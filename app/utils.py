@@ -95,3 +95,11 @@ def decode_token(token: str) -> dict:
         JWTError: If token is invalid or expired
     """
     return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+def percentile_ms(samples, q: float) -> float:
+    """Nearest-rank `q` percentile of durations in seconds, in milliseconds."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000
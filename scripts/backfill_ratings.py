@@ -0,0 +1,36 @@
+"""
+movie.rating_sum / rating_count / rat 을 review 테이블 기준으로,
+review/comment 의 like_count / dislike_count 를 좋아요 테이블 기준으로 다시 계산하는 스크립트
+
+Usage:
+    uv run python scripts/backfill_ratings.py
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.rating_service import backfill_ratings
+from app.services.like_service import backfill_like_counts
+
+
+def main():
+    db = SessionLocal()
+    try:
+        updated = backfill_ratings(db)
+        reacted = backfill_like_counts(db)
+        db.commit()
+        print(f"✓ Recomputed ratings for {updated} movies")
+        print(f"✓ Recomputed like counters for {reacted} reviews/comments")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
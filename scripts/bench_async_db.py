@@ -0,0 +1,139 @@
+"""
+DB 접근 방식별 처리량 벤치마크
+
+같은 쿼리(이메일로 유저 조회 + pg_sleep 으로 흉내 낸 네트워크 지연)를 세 가지 방식의
+엔드포인트로 만들어 uvicorn 한 워커에 띄우고, 동시 요청을 보내 req/s 와 p99 를 비교한다.
+
+- sync-in-async : async def 안에서 동기 Session 사용 (이벤트 루프가 막힘)
+- threadpool    : def 엔드포인트 + 동기 Session (FastAPI 스레드 풀, 기본 40개)
+- async         : async def + AsyncSession (asyncpg)
+
+Usage:
+    uv run python scripts/bench_async_db.py [--concurrency 64] [--requests 2000] [--latency-ms 2]
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import multiprocessing
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import uvicorn
+from fastapi import Depends, FastAPI
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, get_async_db, get_db
+from app.models import User
+
+PORT = 8765
+
+
+def build_app(latency_ms: float) -> FastAPI:
+    app = FastAPI()
+    sleep = text("SELECT pg_sleep(:seconds)")
+    params = {"seconds": latency_ms / 1000}
+
+    def lookup_sync(db: Session, email: str):
+        db.execute(sleep, params)
+        return db.scalar(select(User.uid).where(User.email == email))
+
+    @app.get("/sync-in-async")
+    async def sync_in_async(email: str, db: Session = Depends(get_db)):
+        return {"uid": lookup_sync(db, email)}
+
+    @app.get("/threadpool")
+    def threadpool(email: str, db: Session = Depends(get_db)):
+        return {"uid": lookup_sync(db, email)}
+
+    @app.get("/async")
+    async def fully_async(email: str, db: AsyncSession = Depends(get_async_db)):
+        await db.execute(sleep, params)
+        return {"uid": await db.scalar(select(User.uid).where(User.email == email))}
+
+    return app
+
+
+def serve(latency_ms: float):
+    uvicorn.run(build_app(latency_ms), port=PORT, log_level="warning")
+
+
+def wait_until_ready(timeout: float = 10.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{PORT}/docs")
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError("Benchmark server did not start")
+
+
+def percentile(samples: list, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000
+
+
+async def hammer(path: str, email: str, concurrency: int, total: int):
+    latencies = []
+    remaining = total
+
+    async def worker(client):
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await client.get(path, params={"email": email})
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60
+    ) as client:
+        await client.get(path, params={"email": email})  # warm up the pool
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return total / elapsed, percentile(latencies, 0.99)
+
+
+def main(concurrency: int, total: int, latency_ms: float):
+    db = SessionLocal()
+    email = db.scalar(select(User.email).limit(1))
+    db.close()
+    if email is None:
+        print("No users found; run scripts/seed_data.py first")
+        return
+
+    # Server in its own process so the load generator doesn't share its GIL
+    server = multiprocessing.Process(target=serve, args=(latency_ms,), daemon=True)
+    server.start()
+    wait_until_ready()
+
+    print(
+        f"{total} requests, concurrency {concurrency}, "
+        f"simulated DB latency {latency_ms} ms"
+    )
+    try:
+        for path in ("/sync-in-async", "/threadpool", "/async"):
+            rps, p99 = asyncio.run(hammer(path, email, concurrency, total))
+            print(f"  {path:15s} {rps:8.1f} req/s   p99 {p99:8.1f} ms")
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    main(args.concurrency, args.requests, args.latency_ms)
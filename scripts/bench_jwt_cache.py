@@ -0,0 +1,83 @@
+"""
+요청당 인증 오버헤드 마이크로 벤치마크: JWT 검증 캐시 on/off
+
+가상 유저 N명의 access token 을 만들고 principal 캐시를 미리 채운 뒤(DB 조회 없음),
+get_current_user 를 토큰을 돌려 가며 반복 호출해 호출당 평균 시간(µs)을 잰다.
+jwt.decode 단독 비용도 함께 출력한다.
+
+Usage:
+    uv run python scripts/bench_jwt_cache.py [--users 100] [--requests 20000]
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.requests import Request
+
+from app.dependencies import get_current_user
+from app.models import User
+from app.services.principal_cache import principal_cache
+from app.services.token_cache import verified_tokens
+from app.utils import create_access_token, decode_token
+
+
+def make_tokens(count: int) -> list:
+    tokens = []
+    for uid in range(1, count + 1):
+        email = f"bench_jwt_{uid}@bench.local"
+        principal_cache.set(
+            User(uid=uid, name="bench", nickname=f"bench_jwt_{uid}", email=email)
+        )
+        tokens.append(create_access_token({"sub": email, "uid": uid}))
+    return tokens
+
+
+def time_per_call(fn, tokens: list, total: int) -> float:
+    start = time.perf_counter()
+    for i in range(total):
+        fn(tokens[i % len(tokens)])
+    return (time.perf_counter() - start) / total * 1_000_000
+
+
+async def time_dependency(tokens: list, total: int) -> float:
+    request = Request({"type": "http", "headers": []})
+    start = time.perf_counter()
+    for i in range(total):
+        # db is never touched: every principal is cached
+        await get_current_user(request, tokens[i % len(tokens)], None)
+    return (time.perf_counter() - start) / total * 1_000_000
+
+
+def main(users: int, total: int):
+    tokens = make_tokens(users)
+    print(f"{users} tokens, {total} calls")
+
+    plain = time_per_call(decode_token, tokens, total)
+    verified_tokens.clear()
+    cached = time_per_call(verified_tokens.decode, tokens, total)
+    print(f"  jwt.decode only                 : {plain:7.1f} µs")
+    print(f"  VerifiedTokenCache.decode       : {cached:7.1f} µs")
+
+    verified_tokens.enabled = False
+    without = asyncio.run(time_dependency(tokens, total))
+    verified_tokens.enabled = True
+    verified_tokens.clear()
+    with_cache = asyncio.run(time_dependency(tokens, total))
+    print(f"  get_current_user without cache  : {without:7.1f} µs")
+    print(f"  get_current_user with cache     : {with_cache:7.1f} µs")
+    print(f"  Speedup                         : {without / with_cache:7.2f}x")
+    print(f"  Cache stats: {verified_tokens.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.users, args.requests)
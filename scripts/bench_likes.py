@@ -0,0 +1,116 @@
+"""
+좋아요 토글 처리량 벤치마크: 카운터 즉시 UPDATE vs write-behind 버퍼
+
+가상 유저 N명(bench_like_*)을 만들어 인기 리뷰 하나에 동시에 좋아요/취소를 반복한다.
+즉시 모드는 모든 토글이 같은 review 행의 카운터를 UPDATE 하므로 행 잠금에서 줄을 서고,
+버퍼 모드는 좋아요 행만 쓰고 카운터는 마지막에 한 번 flush 한다.
+끝나면 가상 유저를 지우고 리뷰 카운터를 다시 센다.
+
+Usage:
+    uv run python scripts/bench_likes.py [--review-id 1] [--threads 16] [--ops 200]
+"""
+
+import sys
+import os
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.models import Review, User
+from app.services import like_service
+from app.services.like_service import LIKE, REVIEW, like_buffer
+
+USER_PREFIX = "bench_like_"
+
+
+def create_users(count: int) -> list:
+    db = SessionLocal()
+    try:
+        users = [
+            User(
+                name=f"{USER_PREFIX}{i}",
+                nickname=f"{USER_PREFIX}{i}",
+                email=f"{USER_PREFIX}{i}@bench.local",
+                password="-",
+            )
+            for i in range(count)
+        ]
+        db.add_all(users)
+        db.commit()
+        return [u.uid for u in users]
+    finally:
+        db.close()
+
+
+def cleanup(review_id: int):
+    db = SessionLocal()
+    try:
+        db.query(User).filter(User.nickname.like(f"{USER_PREFIX}%")).delete(
+            synchronize_session=False
+        )
+        like_service.recount(db, REVIEW, [review_id])
+        db.commit()
+    finally:
+        db.close()
+
+
+def toggle_many(review_id: int, user_id: int, ops: int, buffered: bool):
+    db = SessionLocal()
+    try:
+        for _ in range(ops):
+            result = like_service.toggle_reaction(
+                db, REVIEW, review_id, user_id, LIKE, buffered=buffered
+            )
+            db.commit()
+            if buffered:
+                like_buffer.record(REVIEW, review_id, result)
+    finally:
+        db.close()
+
+
+def run(review_id: int, user_ids: list, ops: int, buffered: bool) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(user_ids)) as pool:
+        futures = [
+            pool.submit(toggle_many, review_id, uid, ops, buffered)
+            for uid in user_ids
+        ]
+        for future in futures:
+            future.result()
+    if buffered:
+        like_buffer.flush()
+    elapsed = time.perf_counter() - start
+    return len(user_ids) * ops / elapsed
+
+
+def main(review_id: int, threads: int, ops: int):
+    db = SessionLocal()
+    if db.query(Review).filter(Review.rid == review_id).first() is None:
+        print(f"Review {review_id} not found")
+        return
+    db.close()
+
+    cleanup(review_id)
+    user_ids = create_users(threads)
+    try:
+        print(f"{threads} threads x {ops} toggles on review {review_id}")
+        direct = run(review_id, user_ids, ops, buffered=False)
+        print(f"  Direct counter UPDATE : {direct:8.1f} toggles/s")
+        buffered = run(review_id, user_ids, ops, buffered=True)
+        print(f"  Write-behind buffer   : {buffered:8.1f} toggles/s")
+        print(f"  Speedup               : {buffered / direct:8.2f}x")
+    finally:
+        cleanup(review_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--review-id", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=200)
+    args = parser.parse_args()
+    main(args.review_id, args.threads, args.ops)
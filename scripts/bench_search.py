@@ -0,0 +1,99 @@
+"""
+영화 검색 벤치마크: leading-wildcard ILIKE (seq scan) vs pg_trgm GIN 인덱스
+
+임시 테이블(TEMP)에 가짜 영화 N개(기본 1,000,000)를 만들어 측정하므로
+실제 movie 테이블은 건드리지 않는다.
+
+Usage:
+    uv run python scripts/bench_search.py [--rows 1000000] [--runs 5]
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+KEYWORDS = ["기생충", "어벤져스", "인터스텔라", "Matrix", "love"]
+
+# 한글 음절(가-힣) 3~6자 + 일부 영어 단어를 섞은 제목
+CREATE_TABLE = """
+CREATE TEMP TABLE movie_bench AS
+SELECT
+    g AS mid,
+    CASE WHEN g % 5 = 0
+        THEN (ARRAY['Matrix','Love','Story','Night','Dream'])[1 + (g / 5) % 5]
+             || ' ' || md5(g::text)
+        ELSE (
+            SELECT string_agg(chr(44032 + (random() * 11171)::int), '')
+            FROM generate_series(1, 3 + (g % 4))
+        )
+    END AS title
+FROM generate_series(1, :rows) AS g
+"""
+
+ILIKE_QUERY = "SELECT mid FROM movie_bench WHERE title ILIKE :pattern LIMIT 20"
+RANKED_QUERY = """
+SELECT mid FROM movie_bench
+WHERE title ILIKE :pattern
+ORDER BY word_similarity(:keyword, title) DESC, mid
+LIMIT 20
+"""
+
+
+def measure(conn, sql: str, runs: int) -> float:
+    timings = []
+    for keyword in KEYWORDS:
+        params = {"pattern": f"%{keyword}%", "keyword": keyword}
+        for _ in range(runs):
+            start = time.perf_counter()
+            conn.execute(text(sql), params).fetchall()
+            timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+
+def main(rows: int, runs: int):
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        print(f"Generating {rows:,} movies...")
+        conn.execute(text(CREATE_TABLE), {"rows": rows})
+        conn.execute(text("ANALYZE movie_bench"))
+
+        print("Measuring ILIKE without index...")
+        seq = measure(conn, ILIKE_QUERY, runs)
+        seq_ranked = measure(conn, RANKED_QUERY, runs)
+
+        print("Building GIN (gin_trgm_ops) index...")
+        start = time.perf_counter()
+        conn.execute(
+            text("CREATE INDEX ON movie_bench USING gin (title gin_trgm_ops)")
+        )
+        conn.execute(text("ANALYZE movie_bench"))
+        build = time.perf_counter() - start
+
+        print("Measuring ILIKE with trigram index...")
+        trgm = measure(conn, ILIKE_QUERY, runs)
+        trgm_ranked = measure(conn, RANKED_QUERY, runs)
+        conn.rollback()
+
+    print("\n" + "=" * 60)
+    print(f"rows: {rows:,}  (index build {build:.1f}s)")
+    print(f"{'query':<28}{'seq scan (ms)':>16}{'trigram (ms)':>16}")
+    print(f"{'ILIKE %kw%':<28}{seq:>16.2f}{trgm:>16.2f}")
+    print(f"{'ILIKE + similarity rank':<28}{seq_ranked:>16.2f}{trgm_ranked:>16.2f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark movie search")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    main(args.rows, args.runs)
@@ -34,6 +34,9 @@ def init_db(with_seed=False):
 
     # 3. Create Tables
     print("Creating tables...")
+    with engine.begin() as conn:
+        # Trigram indexes on movie/genre need pg_trgm
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.drop_all(bind=engine)  # Reset for clean state
     Base.metadata.create_all(bind=engine)
 
@@ -0,0 +1,100 @@
+"""
+로그인 부하 중 다른 API 지연 시간 측정
+
+실행 중인 서버에 로그인 요청을 계속 보내면서(bcrypt 부하), 동시에 가벼운 API
+(기본 /api/movies/trend)의 응답 시간을 재서 p50/p99 를 출력한다.
+bcrypt 가 이벤트 루프를 막으면 로그인과 무관한 API 의 p99 가 수백 ms 로 튄다.
+
+Usage:
+    uv run uvicorn app.main:app --workers 1 &
+    uv run python scripts/load_test_auth.py [--url http://localhost:8000] \\
+        [--logins 16] [--seconds 10] [--email kim@example.com --password password123]
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+
+def percentile(samples: list, q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000
+
+
+async def login_loop(client, deadline, email, password, results):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.post(
+            "/api/auth/login", json={"email": email, "password": password}
+        )
+        results.setdefault(response.status_code, []).append(
+            time.perf_counter() - start
+        )
+
+
+async def probe_loop(client, deadline, path, samples):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await client.get(path)
+        samples.append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+
+
+async def run(url, logins, seconds, email, password, probe_path):
+    limits = httpx.Limits(max_connections=logins + 4)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        # Baseline without login load
+        baseline = []
+        await probe_loop(client, time.perf_counter() + 2, probe_path, baseline)
+
+        deadline = time.perf_counter() + seconds
+        login_results = {}
+        under_load = []
+        await asyncio.gather(
+            probe_loop(client, deadline, probe_path, under_load),
+            *(
+                login_loop(client, deadline, email, password, login_results)
+                for _ in range(logins)
+            ),
+        )
+
+    print(f"{probe_path} latency (ms)")
+    print(
+        f"  idle        : p50 {percentile(baseline, 0.5):7.1f}"
+        f"  p99 {percentile(baseline, 0.99):7.1f}  (n={len(baseline)})"
+    )
+    print(
+        f"  under login : p50 {percentile(under_load, 0.5):7.1f}"
+        f"  p99 {percentile(under_load, 0.99):7.1f}  (n={len(under_load)})"
+    )
+    print(f"Logins ({logins} concurrent, {seconds}s)")
+    for status, samples in sorted(login_results.items()):
+        print(
+            f"  HTTP {status}: {len(samples):5d} requests"
+            f"  p50 {percentile(samples, 0.5):7.1f}  p99 {percentile(samples, 0.99):7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--logins", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--email", default="kim@example.com")
+    parser.add_argument("--password", default="password123")
+    parser.add_argument("--probe", default="/api/movies/trend")
+    args = parser.parse_args()
+    asyncio.run(
+        run(
+            args.url, args.logins, args.seconds, args.email, args.password, args.probe
+        )
+    )
@@ -0,0 +1,164 @@
+"""
+기존 DB에 스키마 변경을 적용하는 스크립트 (데이터 유지)
+
+init_db.py 는 테이블을 모두 지우고 다시 만들기 때문에 운영 DB에는 쓸 수 없다.
+여기 있는 마이그레이션은 모두 IF NOT EXISTS 기반이라 여러 번 실행해도 안전하다.
+
+Usage:
+    uv run python scripts/migrate_db.py
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+# (name, statements) - 순서대로 실행
+MIGRATIONS = [
+    (
+        "trigram search indexes",
+        [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            "CREATE INDEX IF NOT EXISTS ix_movie_title_trgm "
+            "ON movie USING gin (title gin_trgm_ops)",
+            "CREATE INDEX IF NOT EXISTS ix_movie_director_trgm "
+            "ON movie USING gin (director gin_trgm_ops)",
+            "CREATE INDEX IF NOT EXISTS ix_genre_name_trgm "
+            "ON genre USING gin (name gin_trgm_ops)",
+        ],
+    ),
+    (
+        "movie rating aggregates",
+        [
+            "ALTER TABLE movie ADD COLUMN IF NOT EXISTS "
+            "rating_sum NUMERIC(12, 1) NOT NULL DEFAULT 0",
+            "ALTER TABLE movie ADD COLUMN IF NOT EXISTS "
+            "rating_count INTEGER NOT NULL DEFAULT 0",
+            "CREATE INDEX IF NOT EXISTS ix_movie_rat ON movie (rat)",
+        ],
+    ),
+    (
+        "trending ranking table",
+        [
+            "CREATE TABLE IF NOT EXISTS movie_trend ("
+            "rank INTEGER PRIMARY KEY, "
+            "mid INTEGER NOT NULL UNIQUE REFERENCES movie(mid) ON DELETE CASCADE, "
+            "score DOUBLE PRECISION NOT NULL DEFAULT 0, "
+            "updated_at TIMESTAMP WITH TIME ZONE DEFAULT now())",
+            "CREATE INDEX IF NOT EXISTS ix_review_created_at ON review (created_at)",
+            "CREATE INDEX IF NOT EXISTS ix_comment_created_at ON comment (created_at)",
+            "CREATE INDEX IF NOT EXISTS ix_review_like_created_at "
+            "ON review_like (created_at)",
+        ],
+    ),
+    (
+        "movie version stamp",
+        [
+            "ALTER TABLE movie ADD COLUMN IF NOT EXISTS "
+            "updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()",
+            "CREATE INDEX IF NOT EXISTS ix_movie_updated_at ON movie (updated_at)",
+        ],
+    ),
+    (
+        "review list index",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_review_mid_created_at "
+            "ON review (mid, created_at DESC, rid DESC)",
+        ],
+    ),
+    (
+        "unique review per user and movie",
+        [
+            # Fails if duplicate (uid, mid) reviews already exist; remove them first
+            "DO $$ BEGIN "
+            "IF NOT EXISTS (SELECT 1 FROM pg_constraint "
+            "WHERE conname = 'review_uid_mid_key') THEN "
+            "ALTER TABLE review ADD CONSTRAINT review_uid_mid_key UNIQUE (uid, mid); "
+            "END IF; END $$",
+        ],
+    ),
+    (
+        "like counters",
+        [
+            "ALTER TABLE review ADD COLUMN IF NOT EXISTS "
+            "like_count INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE review ADD COLUMN IF NOT EXISTS "
+            "dislike_count INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE comment ADD COLUMN IF NOT EXISTS "
+            "like_count INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE comment ADD COLUMN IF NOT EXISTS "
+            "dislike_count INTEGER NOT NULL DEFAULT 0",
+            "DO $$ BEGIN "
+            "IF NOT EXISTS (SELECT 1 FROM pg_constraint "
+            "WHERE conname = 'review_like_rid_uid_key') THEN "
+            "ALTER TABLE review_like ADD CONSTRAINT review_like_rid_uid_key "
+            "UNIQUE (rid, uid); "
+            "END IF; "
+            "IF NOT EXISTS (SELECT 1 FROM pg_constraint "
+            "WHERE conname = 'comment_like_cid_uid_key') THEN "
+            "ALTER TABLE comment_like ADD CONSTRAINT comment_like_cid_uid_key "
+            "UNIQUE (cid, uid); "
+            "END IF; END $$",
+        ],
+    ),
+    (
+        "like row updated_at",
+        [
+            "ALTER TABLE review_like ADD COLUMN IF NOT EXISTS "
+            "updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()",
+            "ALTER TABLE comment_like ADD COLUMN IF NOT EXISTS "
+            "updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()",
+            "CREATE INDEX IF NOT EXISTS ix_review_like_updated_at "
+            "ON review_like (updated_at)",
+            "CREATE INDEX IF NOT EXISTS ix_comment_like_updated_at "
+            "ON comment_like (updated_at)",
+        ],
+    ),
+    (
+        "comment thread index",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_comment_rid_created_at "
+            "ON comment (rid, created_at, cid)",
+        ],
+    ),
+    (
+        "rating sort index",
+        [
+            # Matches the RATING sort/cursor key in /api/movies/search
+            "CREATE INDEX IF NOT EXISTS ix_movie_rat_sort "
+            "ON movie ((coalesce(rat, 0)) DESC, mid DESC)",
+        ],
+    ),
+    (
+        "imported movie rating",
+        [
+            "ALTER TABLE movie ADD COLUMN IF NOT EXISTS imported_rat NUMERIC(2, 1)",
+            # Only movies without rated reviews still hold their imported rating
+            "UPDATE movie SET imported_rat = rat "
+            "WHERE imported_rat IS NULL AND NOT EXISTS ("
+            "SELECT 1 FROM review WHERE review.mid = movie.mid "
+            "AND review.rat IS NOT NULL)",
+        ],
+    ),
+]
+
+
+def migrate():
+    for name, statements in MIGRATIONS:
+        print(f"Applying: {name}...")
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+    print("✓ Migrations applied")
+    print(
+        "Run scripts/backfill_ratings.py once to fill the rating and like aggregates."
+    )
+
+
+if __name__ == "__main__":
+    migrate()
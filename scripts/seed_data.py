@@ -25,6 +25,8 @@ from app.models import (
     CommentLike,
 )
 from app.utils import get_password_hash
+from app.services.rating_service import backfill_ratings
+from app.services.like_service import backfill_like_counts
 
 
 # =========================
@@ -225,7 +227,7 @@ def seed_movies(db: Session, genres: list):
     movies = []
     for data in movies_data:
         genre_names = data.pop("genre_names")
-        movie = Movie(**data)
+        movie = Movie(**data, imported_rat=data.get("rat"))
         db.add(movie)
         db.flush()
 
@@ -325,8 +327,12 @@ def seed_all():
         genres = seed_genres(db)
         movies = seed_movies(db, genres)
         reviews = seed_reviews(db, users, movies)
+        backfill_ratings(db)
+        db.commit()
         comments = seed_comments(db, users, reviews)
         seed_likes(db, users, reviews, comments)
+        backfill_like_counts(db)
+        db.commit()
 
         print("=" * 50)
         print("✅ Seeding completed successfully!")
@@ -2,10 +2,13 @@
 비동기 Redis 토큰 서비스 테스트 스크립트
 
 이 스크립트는 Redis 연결 및 토큰 서비스의 기본 동작을 테스트합니다.
+TOKEN_BACKEND=redis 로 실행해야 토큰 서비스가 Redis 를 사용합니다.
+
+    TOKEN_BACKEND=redis uv run python test_redis_async.py
 """
 
 import asyncio
-from app.redis_client import get_redis_client
+from app.redis_client import RedisUnavailable, redis_pool
 from app.services.token_service import TokenBlacklistService, RefreshTokenService
 from app.utils import create_access_token, create_refresh_token
 from datetime import timedelta
@@ -17,18 +20,15 @@ async def test_redis_connection():
     print("1. Redis 연결 테스트")
     print("=" * 60)
 
-    redis_client = None
+    # 앱 lifespan 과 같은 공유 연결 풀 사용
+    await redis_pool.start()
     try:
-        redis_client = get_redis_client()
-        await redis_client.ping()
+        await redis_pool.call(lambda client: client.ping())
         print("✓ Redis 연결 성공!")
         return True
-    except Exception as e:
+    except RedisUnavailable as e:
         print(f"✗ Redis 연결 실패: {e}")
         return False
-    finally:
-        if redis_client:
-            await redis_client.aclose()
 
 
 async def test_token_blacklist():
@@ -153,6 +153,14 @@ async def main():
     print("Redis 비동기 토큰 서비스 테스트")
     print("=" * 60)
 
+    try:
+        await run_tests()
+    finally:
+        print(f"Redis 통계: {redis_pool.stats()}")
+        await redis_pool.close()
+
+
+async def run_tests():
     # Redis 연결 테스트
     if not await test_redis_connection():
         print("\n❌ Redis 연결 실패. Redis 서버가 실행 중인지 확인하세요.")
@@ -0,0 +1,88 @@
+"""
+공용 pytest fixture
+
+테스트는 .env 의 PostgreSQL 에 붙되, 한 트랜잭션 안에서만 데이터를 만들고 끝나면
+롤백한다. 라우터의 get_db 도 같은 연결(SAVEPOINT)을 쓰도록 바꿔 끼운다.
+DB 에 접속할 수 없으면 DB 가 필요한 테스트는 skip 된다.
+"""
+
+import os
+
+# Settings require these; a real .env overrides them
+for name, value in {
+    "DB_USER": "postgres",
+    "DB_PASS": "postgres",
+    "DB_HOST": "localhost",
+    "DB_NAME": "postgres",
+}.items():
+    os.environ.setdefault(name, value)
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.database import engine, get_db
+from app.main import app
+from app.services.shared_cache import shared_cache
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    try:
+        with engine.connect():
+            pass
+    except OperationalError:
+        pytest.skip("PostgreSQL from .env is not reachable")
+    return engine
+
+
+@pytest.fixture
+def db(db_engine):
+    """Session inside an outer transaction that is rolled back after the test."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def client(db):
+    """
+    TestClient whose requests use the `db` session.
+
+    The lifespan (background jobs, LISTEN connection) is not started.
+    """
+    app.dependency_overrides[get_db] = lambda: db
+    shared_cache.clear_local()
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+        shared_cache.clear_local()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+@pytest.fixture
+def count_queries(db):
+    """Count the SQL statements run on the test connection."""
+    counter = QueryCounter()
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(connection, "before_cursor_execute", counter)
@@ -0,0 +1,97 @@
+"""
+영화 목록 API 의 쿼리 수가 페이지 크기와 무관한지 확인 (장르 N+1 회귀 방지)
+
+각 엔드포인트를 작은 페이지와 큰 페이지로 캐시 없이 호출해서 실행된 SQL 문 개수가
+같고, 기대한 상수와 일치하는지 본다.
+"""
+
+import pytest
+
+from app.models import Genre, Movie, MovieGenre, MovieTrend
+from app.services.cache import response_cache
+from app.services.recommend_service import candidate_pool
+from app.services.shared_cache import shared_cache
+
+MOVIE_COUNT = 12
+
+
+@pytest.fixture
+def movies(db):
+    """Rated movies with two genres each, created inside the test transaction."""
+    genres = [Genre(name=f"test-genre-{i}") for i in range(3)]
+    db.add_all(genres)
+    db.flush()
+
+    movies = [Movie(title=f"Test movie {i}", rat=4.0) for i in range(MOVIE_COUNT)]
+    db.add_all(movies)
+    db.flush()
+    db.add_all(
+        MovieGenre(mid=movie.mid, gid=genres[(i + j) % len(genres)].gid)
+        for i, movie in enumerate(movies)
+        for j in range(2)
+    )
+    db.flush()
+    return movies
+
+
+def run(client, count_queries, url: str) -> int:
+    shared_cache.clear_local()
+    count_queries.count = 0
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    return count_queries.count
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        # COUNT + page + genres
+        ("", 3),
+        # page + genres
+        ("&cursor=&withTotal=false", 2),
+        ("&cursor=&withTotal=false&sortBy=RATING", 2),
+    ],
+)
+def test_search_query_count_is_constant(
+    client, count_queries, movies, params, expected
+):
+    small = run(client, count_queries, f"/api/movies/search?size=2{params}")
+    large = run(client, count_queries, f"/api/movies/search?size={MOVIE_COUNT}{params}")
+    assert small == large == expected
+
+
+def test_trend_query_count_is_constant(client, count_queries, db, movies):
+    def rank(count: int):
+        db.query(MovieTrend).delete()
+        db.add_all(
+            MovieTrend(rank=i + 1, mid=movie.mid, score=1.0)
+            for i, movie in enumerate(movies[:count])
+        )
+        db.flush()
+
+    rank(1)
+    small = run(client, count_queries, "/api/movies/trend")
+    rank(10)
+    large = run(client, count_queries, "/api/movies/trend")
+    # catalog version (2) + ranking + genres
+    assert small == large == 4
+
+
+def test_recommended_query_count_is_constant(client, count_queries, db, movies):
+    candidate_pool.refresh(db)
+
+    def cold(limit: int) -> int:
+        response_cache.clear()
+        return run(client, count_queries, f"/api/movies/recommended?limit={limit}")
+
+    # movies + genres for the cache misses
+    assert cold(1) == cold(MOVIE_COUNT) == 2
+
+
+@pytest.mark.parametrize("size, expected", [(0, 1), (1000, MOVIE_COUNT)])
+def test_search_size_is_clamped(client, movies, size, expected):
+    response = client.get(
+        f"/api/movies/search?keyword=Test movie&size={size}&cursor=&withTotal=false"
+    )
+    assert response.status_code == 200, response.text
+    assert len(response.json()["movies"]) == expected
@@ -0,0 +1,23 @@
+"""
+catalog_version: 트렌드 본문이 바뀌는 변경마다 버전 스탬프도 바뀌는지 확인
+"""
+
+from app.models import Movie, MovieTrend
+from app.services.movie_service import catalog_version
+
+
+def test_catalog_version_changes_when_a_ranked_movie_is_deleted(db):
+    movies = [Movie(title=f"Ranked {i}") for i in range(2)]
+    db.add_all(movies)
+    db.flush()
+    db.add_all(
+        MovieTrend(rank=1000 + i, mid=movie.mid, score=1.0)
+        for i, movie in enumerate(movies)
+    )
+    db.flush()
+    before, _ = catalog_version(db)
+
+    db.delete(movies[0])
+    db.flush()
+    db.expire_all()
+    assert catalog_version(db)[0] != before
@@ -0,0 +1,55 @@
+"""
+프로필 캐시: 관리자가 영화를 고치거나 지우면 리뷰를 쓴 유저의 캐시된 프로필도 바뀌는지 확인
+"""
+
+import pytest
+
+from app.main import app
+from app.models import Movie, Review, User
+from app.routers.admin import require_admin
+
+
+@pytest.fixture
+def reviewed_movie(db):
+    movie = Movie(title="Old title")
+    user = User(
+        name="reviewer",
+        nickname="test-reviewer",
+        email="test-reviewer@test.local",
+        password="x",
+    )
+    db.add_all([movie, user])
+    db.flush()
+    db.add(Review(uid=user.uid, mid=movie.mid, dec="Nice", rat=4.0))
+    db.flush()
+    return movie
+
+
+@pytest.fixture
+def admin_client(client, db):
+    app.dependency_overrides[require_admin] = lambda: User(uid=0, is_admin=True)
+    return client
+
+
+def profile_titles(client) -> list:
+    response = client.get("/api/user/profile/test-reviewer")
+    assert response.status_code == 200, response.text
+    return [review["movieTitle"] for review in response.json()["reviews"]]
+
+
+def test_renaming_a_movie_refreshes_reviewer_profiles(admin_client, reviewed_movie):
+    assert profile_titles(admin_client) == ["Old title"]
+
+    response = admin_client.put(
+        f"/api/admin/movies/{reviewed_movie.mid}", json={"title": "New title"}
+    )
+    assert response.status_code == 200, response.text
+    assert profile_titles(admin_client) == ["New title"]
+
+
+def test_deleting_a_movie_refreshes_reviewer_profiles(admin_client, reviewed_movie):
+    assert profile_titles(admin_client) == ["Old title"]
+
+    response = admin_client.delete(f"/api/admin/movies/{reviewed_movie.mid}")
+    assert response.status_code == 200, response.text
+    assert profile_titles(admin_client) == []
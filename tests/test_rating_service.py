@@ -0,0 +1,71 @@
+"""
+영화 평점 집계: 마지막 리뷰 삭제와 backfill 이 같은 평점을 남기는지 확인
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from app.models import Movie, Review, User
+from app.services.rating_service import (
+    apply_review_rating,
+    backfill_ratings,
+    insert_review_with_rating,
+)
+
+
+@pytest.fixture
+def movie(db):
+    movie = Movie(title="Rated movie", rat=4.5, imported_rat=4.5)
+    db.add(movie)
+    db.flush()
+    return movie
+
+
+@pytest.fixture
+def user(db):
+    user = User(
+        name="rater", nickname="test-rater", email="test-rater@test.local", password="x"
+    )
+    db.add(user)
+    db.flush()
+    return user
+
+
+def current_rating(db, movie):
+    db.expire(movie)
+    return movie.rat, movie.rating_count
+
+
+def test_deleting_last_review_restores_imported_rating(db, movie, user):
+    review = insert_review_with_rating(db, user.uid, movie.mid, "meh", 2.0)
+    assert current_rating(db, movie) == (Decimal("2.0"), 1)
+
+    db.query(Review).filter(Review.rid == review.rid).delete()
+    apply_review_rating(db, movie.mid, 2.0, added=False)
+    deleted = current_rating(db, movie)
+
+    backfill_ratings(db)
+    backfilled = current_rating(db, movie)
+
+    assert deleted == backfilled == (Decimal("4.5"), 0)
+
+
+def test_backfill_averages_reviews(db, movie, user):
+    insert_review_with_rating(db, user.uid, movie.mid, "good", 3.0)
+    backfill_ratings(db)
+    assert current_rating(db, movie) == (Decimal("3.0"), 1)
+
+
+def test_movie_without_imported_rating_falls_back_to_zero(db, user):
+    movie = Movie(title="Admin movie")
+    db.add(movie)
+    db.flush()
+    review = insert_review_with_rating(db, user.uid, movie.mid, "ok", 3.0)
+
+    db.query(Review).filter(Review.rid == review.rid).delete()
+    apply_review_rating(db, movie.mid, 3.0, added=False)
+    deleted = current_rating(db, movie)
+
+    backfill_ratings(db)
+    assert deleted == current_rating(db, movie) == (Decimal("0.0"), 0)
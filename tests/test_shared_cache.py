@@ -0,0 +1,120 @@
+"""
+2단 응답 캐시의 Redis(L2) 경로를 fakeredis 로 확인
+
+워커 여러 개는 같은 FakeServer 를 보는 SharedCache 인스턴스 여러 개로 흉내 낸다.
+"""
+
+import threading
+import time
+
+import fakeredis
+import pytest
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from app.redis_client import BreakerRedis, CircuitBreaker
+from app.services import shared_cache as shared_cache_module
+from app.services.cache import response_cache
+from app.services.shared_cache import SharedCache
+
+KEY = "movies:test"
+
+
+@pytest.fixture
+def redis_server(monkeypatch):
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeRedis(server=server)
+    monkeypatch.setattr(shared_cache_module, "get_cache_redis", lambda: client)
+    response_cache.clear()
+    yield client
+    response_cache.clear()
+
+
+class Builder:
+    """Counts calls; optionally slow so concurrent callers overlap."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> bytes:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return b'{"value": 1}'
+
+
+def test_l2_miss_then_hit(redis_server):
+    build = Builder()
+    worker = SharedCache()
+
+    assert worker.get_or_build(KEY, build, ttl=60) == b'{"value": 1}'
+    assert build.calls == 1
+    assert worker.l2_stats.misses == 1
+    assert redis_server.exists(KEY)
+
+    # Another worker reads the same entry from Redis without building
+    other = SharedCache()
+    assert other.get_or_build(KEY, build, ttl=60) == b'{"value": 1}'
+    assert build.calls == 1
+    assert other.l2_stats.hits == 1
+
+
+def test_concurrent_misses_build_once(redis_server):
+    build = Builder(delay=0.2)
+    workers = [SharedCache(), SharedCache()]
+    results = []
+
+    def request(worker):
+        results.append(worker.get_or_build(KEY, build, ttl=60))
+
+    threads = [
+        threading.Thread(target=request, args=(workers[i % 2],)) for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert build.calls == 1
+    assert results == [b'{"value": 1}'] * 8
+    assert not redis_server.exists(f"lock:{KEY}")
+
+
+def test_invalidate_removes_l2_entry(redis_server):
+    build = Builder()
+    worker = SharedCache()
+    worker.get_or_build(KEY, build, ttl=60)
+
+    worker.invalidate(KEY)
+    assert not redis_server.exists(KEY)
+    worker.get_or_build(KEY, build, ttl=60)
+    assert build.calls == 2
+
+    worker.invalidate_prefix("movies:")
+    assert not redis_server.exists(KEY)
+
+
+def test_outage_falls_back_to_local_cache_fast(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    # Nothing listens on port 1: every connection is refused
+    client = BreakerRedis(
+        breaker,
+        host="127.0.0.1",
+        port=1,
+        socket_connect_timeout=0.5,
+        retry=Retry(NoBackoff(), 0),
+    )
+    monkeypatch.setattr(shared_cache_module, "get_cache_redis", lambda: client)
+    response_cache.clear()
+    build = Builder()
+    worker = SharedCache()
+
+    start = time.monotonic()
+    for i in range(5):
+        assert worker.get_or_build(f"{KEY}:{i}", build, ttl=60) == b'{"value": 1}'
+    assert time.monotonic() - start < 1
+    assert build.calls == 5
+    assert breaker.state == CircuitBreaker.OPEN
+    response_cache.clear()
@@ -0,0 +1,38 @@
+"""
+비슷한 영화 인덱스: 버전 디렉터리 공개와 재빌드 잠금 확인
+"""
+
+import os
+
+from sqlalchemy.orm import Session
+
+from app.models import Movie
+from app.services.similar_service import CURRENT_FILE, KEEP_VERSIONS, SimilarIndex
+
+
+def test_build_publishes_a_new_version(db, tmp_path):
+    db.add_all(Movie(title=f"Similar {i}", dec="우주 탐사 영화") for i in range(3))
+    db.flush()
+    index = SimilarIndex(str(tmp_path), k=2)
+
+    assert index.build(db)
+    first = index.version
+    assert (tmp_path / CURRENT_FILE).read_text() == first
+    assert {"ids.npy", "tfidf.npz", "vocab.json"} <= set(os.listdir(tmp_path / first))
+
+    for _ in range(KEEP_VERSIONS):
+        assert index.build(db)
+    versions = [name for name in os.listdir(tmp_path) if name.startswith("v")]
+    assert len(versions) == KEEP_VERSIONS
+    assert first not in versions
+    assert index.version == index.published_version()
+
+
+def test_build_is_skipped_while_another_worker_rebuilds(db, db_engine, tmp_path):
+    index = SimilarIndex(str(tmp_path), k=2)
+    assert index.build(db)  # holds the lock until the test transaction ends
+    published = index.published_version()
+
+    with db_engine.connect() as connection, Session(bind=connection) as other:
+        assert not SimilarIndex(str(tmp_path), k=2).build(other)
+    assert index.published_version() == published
@@ -0,0 +1,61 @@
+"""
+Redis 토큰 저장소: 장애 중 쓰기가 복구 후에도 유지되는지 fakeredis 로 확인
+
+워커 두 개는 같은 FakeServer 를 보는 RedisTokenStore 두 개로 흉내 낸다.
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from app.redis_client import CircuitBreaker, redis_pool
+from app.services import token_service
+from app.services.token_service import (
+    RedisTokenStore,
+    RefreshTokenService,
+    TokenBlacklistService,
+)
+from app.utils import create_access_token
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(redis_pool, "client", client)
+    # Open on the first failure, retry on the next call
+    monkeypatch.setattr(redis_pool, "breaker", CircuitBreaker(1, 0))
+    monkeypatch.setattr(token_service, "token_store", RedisTokenStore())
+    return server
+
+
+def test_token_blacklisted_during_outage_stays_rejected(server):
+    token = create_access_token({"sub": "outage@test.local"})
+
+    async def scenario():
+        server.connected = False
+        assert await TokenBlacklistService.add_to_blacklist(token)
+        assert await TokenBlacklistService.is_blacklisted(token)
+
+        server.connected = True
+        assert await TokenBlacklistService.is_blacklisted(token)
+        # Replayed to Redis, so other workers reject it too
+        other_worker = RedisTokenStore()
+        return await other_worker.exists(TokenBlacklistService._key(token))
+
+    assert asyncio.run(scenario())
+
+
+def test_refresh_token_deleted_during_outage_stays_deleted(server):
+    email = "outage@test.local"
+
+    async def scenario():
+        await RefreshTokenService.store_refresh_token(email, "refresh")
+        server.connected = False
+        await RefreshTokenService.delete_refresh_token(email)
+
+        server.connected = True
+        return await RefreshTokenService.get_refresh_token(email)
+
+    assert asyncio.run(scenario()) is None